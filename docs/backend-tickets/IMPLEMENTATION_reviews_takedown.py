@@ -6,13 +6,34 @@ This module implements the 3 missing review takedown endpoints:
 2. GET /api/v1/admin/reviews/takedown-requests/{request_id} - Get request details
 3. POST /api/v1/admin/reviews/takedown-requests/{request_id}/resolve - Resolve request
 
+Supporting endpoints:
+- GET /api/v1/admin/reviews/takedown-requests:batch - Get up to 50 request details at once
+- POST /api/v1/admin/reviews/takedown-requests/{request_id}/evidence - Upload evidence file
+- GET /api/v1/admin/reviews/takedown-requests/{request_id}/evidence - Paginated evidence
+- GET /api/v1/admin/reviews/takedown-requests/{request_id}/evidence/{evidence_id}/content - File (Range)
+- GET /api/v1/admin/reviews/takedown-requests/{request_id}/evidence/{evidence_id}/thumbnail - Thumbnail
+- POST /api/v1/admin/reviews/takedown-requests:bulk - Bulk create takedown requests
+- GET /api/v1/admin/reviews/takedown-analytics/resolution-time - Resolution time percentiles
+- GET /api/v1/admin/reviews/takedown-admission/metrics - Queued/shed request counters
+- GET /api/v1/admin/reviews/takedown-router/ready - Readiness after worker warm-up
+
 INSTALLATION INSTRUCTIONS:
 1. Copy this file to: backend/app/routers/admin/reviews_takedown.py
 2. Add to backend/app/main.py:
    from app.routers.admin import reviews_takedown
    app.include_router(reviews_takedown.router, prefix="/api/v1/admin", tags=["Admin Reviews Takedown"])
-3. Run migrations (see schema below)
-4. Test endpoints
+3. Optionally enable response compression in main.py (brotli if brotli-asgi is installed, else gzip):
+   reviews_takedown.install_response_compression(app)
+4. Reject oversized evidence uploads before they are parsed (required when the upload route is enabled):
+   reviews_takedown.install_evidence_upload_limit(app)
+5. Warm each worker before it takes traffic (pass the SQLAlchemy engine to pre-fill its pool)
+   and use /reviews/takedown-router/ready as the readiness probe:
+   reviews_takedown.install_takedown_warmup(app, engine)
+6. Run migrations (see schema below)
+7. Test endpoints
+
+Evidence uploads need python-multipart. Pillow (image thumbnails) and pypdf
+(PDF page counts) are optional.
 
 Created: November 12, 2025
 Ticket: BACKEND-REVIEWS-002
@@ -20,17 +41,35 @@ Ticket: BACKEND-REVIEWS-002
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional, Literal, List, Dict, Any
-from uuid import UUID
-
-from fastapi import APIRouter, Depends, HTTPException, Query, Header, status
+import asyncio
+import json
+import math
+import mimetypes
+import multiprocessing
+import os
+import random
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional, Literal, List, Dict, Any, Sequence, Callable, Iterator, Tuple, Union, Annotated
+from urllib.parse import quote
+from uuid import UUID, uuid4
+
+from fastapi import APIRouter, FastAPI, Depends, HTTPException, Query, Header, File, Form, UploadFile, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field, validator
-from sqlalchemy import select, func, and_, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, func, and_, or_, text
+from sqlalchemy.orm import Session, defer, joinedload, selectinload
 
 # Import your project's dependencies
-# from app.database import get_db
+# from app.database import get_db, SessionLocal
 # from app.models import ReviewTakedownRequest, Review, Vendor, User, AdminUser
 # from app.auth import get_current_admin_user, check_permission
 # from app.services import NotificationService, AuditService
@@ -72,8 +111,8 @@ class VendorInfo(BaseModel):
     rejected_takedowns: int = 0
 
 
-class ReviewInfo(BaseModel):
-    """Review information in takedown request"""
+class ReviewBase(BaseModel):
+    """Review fields shared by the nested and normalized list shapes"""
     id: str
     rating: int
     title: str
@@ -81,6 +120,10 @@ class ReviewInfo(BaseModel):
     status: str
     created_at: datetime
     updated_at: Optional[datetime] = None
+
+
+class ReviewInfo(ReviewBase):
+    """Review information in takedown request"""
     reviewer: ReviewerInfo
 
 
@@ -95,6 +138,21 @@ class Evidence(BaseModel):
     description: str
     content: Optional[str] = None  # For text type
     uploaded_at: Optional[datetime] = None
+    content_type: Optional[str] = None
+    processing_status: Optional[Literal["pending", "ready", "failed"]] = None
+    width: Optional[int] = None  # Images
+    height: Optional[int] = None  # Images
+    page_count: Optional[int] = None  # PDF documents
+
+
+class EvidenceSummary(BaseModel):
+    """Evidence counts and thumbnails for list views"""
+    total: int = 0
+    images: int = 0
+    documents: int = 0
+    texts: int = 0
+    total_size_bytes: int = 0
+    thumbnail_urls: List[str] = []
 
 
 class AdminUserInfo(BaseModel):
@@ -115,16 +173,15 @@ class Resolution(BaseModel):
     reviewer_notified: bool = False
 
 
-class TakedownRequestList(BaseModel):
-    """Takedown request in list view"""
+class TakedownRequestBase(BaseModel):
+    """Takedown request fields shared by the nested and normalized list shapes"""
     id: str
     request_number: str
     status: Literal["open", "accepted", "rejected"]
-    review: ReviewInfo
-    vendor: VendorInfo
     reason_code: str
     reason_description: str
     evidence: List[Evidence] = []
+    evidence_summary: Optional[EvidenceSummary] = None
     vendor_notes: Optional[str] = None
     priority: Literal["high", "medium", "low"]
     created_at: datetime
@@ -134,6 +191,12 @@ class TakedownRequestList(BaseModel):
     admin_notes: Optional[str] = None
 
 
+class TakedownRequestList(TakedownRequestBase):
+    """Takedown request in list view"""
+    review: ReviewInfo
+    vendor: VendorInfo
+
+
 class BookingInfo(BaseModel):
     """Booking information"""
     id: str
@@ -189,6 +252,21 @@ class ResolveRequest(BaseModel):
         return v
 
 
+class TakedownCreateItem(BaseModel):
+    """Single takedown submission in a bulk create batch (vendor comes from the review)"""
+    review_id: UUID
+    reason_code: str = Field(..., min_length=1, max_length=50)
+    reason_description: str = Field(..., min_length=1)
+    evidence: List[Evidence] = []
+    vendor_notes: Optional[str] = None
+    priority: Literal["high", "medium", "low"] = "medium"
+
+
+class BulkCreateRequest(BaseModel):
+    """Request body for bulk takedown creation"""
+    items: List[TakedownCreateItem] = Field(..., min_length=1, max_length=500)
+
+
 class PaginationMeta(BaseModel):
     """Pagination metadata"""
     page: int
@@ -203,41 +281,1387 @@ class PaginationMeta(BaseModel):
 class TakedownListResponse(BaseModel):
     """Response for list endpoint"""
     success: bool = True
+    shape: Literal["nested"] = "nested"
     data: List[TakedownRequestList]
     meta: PaginationMeta
 
 
+class ReviewCompact(ReviewBase):
+    """Review in normalized list view; reviewer is in the reviewers table"""
+    reviewer_id: str
+
+
+class TakedownRequestCompact(TakedownRequestBase):
+    """Takedown request in normalized list view; vendor is in the vendors table"""
+    review: ReviewCompact
+    vendor_id: str
+
+
+class TakedownListNormalizedResponse(BaseModel):
+    """Response for list endpoint with shape=normalized"""
+    success: bool = True
+    shape: Literal["normalized"] = "normalized"
+    data: List[TakedownRequestCompact]
+    vendors: Dict[str, VendorInfo]
+    reviewers: Dict[str, ReviewerInfo]
+    meta: PaginationMeta
+
+
+# Discriminated on "shape" so response validation only checks the matching model
+TakedownListAnyResponse = Annotated[
+    Union[TakedownListResponse, TakedownListNormalizedResponse],
+    Field(discriminator="shape"),
+]
+
+
 class TakedownDetailResponse(BaseModel):
     """Response for detail endpoint"""
     success: bool = True
     data: TakedownRequestDetail
 
 
+class TakedownBatchResponse(BaseModel):
+    """Response for batch detail endpoint"""
+    success: bool = True
+    data: List[TakedownRequestDetail]
+    meta: Dict[str, Any]
+
+
+class EvidenceListResponse(BaseModel):
+    """Response for evidence list endpoint"""
+    success: bool = True
+    data: List[Evidence]
+    meta: PaginationMeta
+
+
+class EvidenceUploadResponse(BaseModel):
+    """Response for evidence upload endpoint"""
+    success: bool = True
+    data: Evidence
+
+
 class ResolveResponse(BaseModel):
     """Response for resolve endpoint"""
     success: bool = True
     data: Dict[str, Any]
 
 
+class BulkCreateResponse(BaseModel):
+    """Response for bulk create endpoint"""
+    success: bool = True
+    data: Dict[str, Any]
+
+
+class DurationPercentiles(BaseModel):
+    """Percentiles of a duration distribution, in hours"""
+    count: int = 0
+    p50_hours: Optional[float] = None
+    p90_hours: Optional[float] = None
+    p99_hours: Optional[float] = None
+    mean_hours: Optional[float] = None
+
+
+class ResolutionAnalytics(BaseModel):
+    """Resolution time and open queue age over a date range"""
+    from_date: Optional[date] = None
+    to_date: Optional[date] = None
+    reason_code: Optional[str] = None
+    vendor_id: Optional[str] = None
+    resolution_time: DurationPercentiles
+    open_queue_age: DurationPercentiles
+    relative_accuracy: float
+    open_queue_age_error_hours: float
+
+
+class ResolutionAnalyticsResponse(BaseModel):
+    """Response for resolution analytics endpoint"""
+    success: bool = True
+    data: ResolutionAnalytics
+
+
 class ErrorResponse(BaseModel):
     """Error response"""
     success: bool = False
     error: Dict[str, Any]
 
 
+class AdmissionMetricsResponse(BaseModel):
+    """Response for admission metrics endpoint"""
+    success: bool = True
+    data: Dict[str, Any]
+
+
+class ReadinessResponse(BaseModel):
+    """Response for router readiness endpoint"""
+    success: bool = True
+    data: Dict[str, Any]
+
+
+# ========================================
+# Admission Control
+# ========================================
+
+# DB connections the takedown endpoints may hold at once. SQLAlchemy's default
+# pool is pool_size=5 + max_overflow=10 = 15; the default leaves 3 of those for
+# the other admin routers during a moderation drive.
+TAKEDOWN_POOL_BUDGET = int(os.environ.get("TAKEDOWN_POOL_BUDGET", "12"))
+
+# Per-endpoint share of the pool budget (pool_weight, turned into max_concurrent
+# by _allocate_pool_budget) and wait queue limits. Endpoints with borrow=True
+# may go past their share into any unused budget and get freed connections
+# ahead of the others, which keep ADMISSION_RESERVED connections each.
+TAKEDOWN_ADMISSION_LIMITS: Dict[str, Dict[str, Any]] = {
+    "resolve": {"pool_weight": 4, "borrow": True, "max_queue": 24, "queue_timeout_s": 5.0, "retry_after_s": 2},
+    "list": {"pool_weight": 2, "max_queue": 8, "queue_timeout_s": 1.0, "retry_after_s": 1},
+    "detail": {"pool_weight": 3, "max_queue": 12, "queue_timeout_s": 1.0, "retry_after_s": 1},
+    "batch_detail": {"pool_weight": 1, "max_queue": 4, "queue_timeout_s": 1.0, "retry_after_s": 1},
+    "evidence": {"pool_weight": 1, "max_queue": 8, "queue_timeout_s": 1.0, "retry_after_s": 1},
+    "bulk_create": {"pool_weight": 1, "max_queue": 4, "queue_timeout_s": 10.0, "retry_after_s": 5},
+}
+
+# Connections each endpoint gets before freed ones go to borrowing endpoints
+ADMISSION_RESERVED = 1
+
+# Rows per multi-row INSERT statement in bulk create
+BULK_INSERT_CHUNK_SIZE = 250
+
+# Max ids per batch detail request
+BATCH_DETAIL_MAX_IDS = 50
+
+
+class PoolBudget:
+    """
+    DB connections shared by the takedown endpoint limiters.
+
+    Limiters take connections up to their ``max_concurrent`` share, or up to
+    the whole budget with ``borrow``. A freed connection goes first to a
+    waiter whose limiter holds fewer than its ``reserved`` connections (so
+    reads are never starved), then to borrowing limiters (resolve), then to
+    the rest in arrival order.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.in_use = 0
+        self._waiters: List[Tuple["AdmissionLimiter", asyncio.Future]] = []
+
+    def _grant(self, limiter: "AdmissionLimiter"):
+        self.in_use += 1
+        limiter.in_flight += 1
+
+    def try_acquire(self, limiter: "AdmissionLimiter") -> bool:
+        """Take a connection without waiting if one is free for this limiter"""
+        if self.in_use < self.size and limiter.in_flight < limiter.borrow_limit:
+            self._grant(limiter)
+            return True
+        return False
+
+    def enqueue(self, limiter: "AdmissionLimiter") -> asyncio.Future:
+        """Future resolved once a connection has been granted to the limiter"""
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((limiter, waiter))
+        return waiter
+
+    def withdraw(self, limiter: "AdmissionLimiter", waiter: asyncio.Future):
+        """Give up a wait, returning the connection if it was granted meanwhile"""
+        if waiter.done():
+            self.release(limiter)
+        else:
+            self._waiters.remove((limiter, waiter))
+
+    def release(self, limiter: "AdmissionLimiter"):
+        self.in_use -= 1
+        limiter.in_flight -= 1
+        while self.in_use < self.size:
+            eligible = [
+                (limiter.in_flight >= limiter.reserved, not limiter.borrow, position)
+                for position, (limiter, _) in enumerate(self._waiters)
+                if limiter.in_flight < limiter.borrow_limit
+            ]
+            if not eligible:
+                return
+            next_limiter, waiter = self._waiters.pop(min(eligible)[2])
+            self._grant(next_limiter)
+            waiter.set_result(None)
+
+
+class AdmissionLimiter:
+    """
+    Concurrency limit with a bounded wait queue for one endpoint.
+
+    Up to ``max_concurrent`` requests (its share of the PoolBudget) run at
+    once, or up to the whole budget with ``borrow``; up to ``max_queue`` more
+    wait at most ``queue_timeout_s`` for a connection.
+    Anything beyond that is shed with 503 + Retry-After.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        budget: PoolBudget,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout_s: float,
+        retry_after_s: int,
+        borrow: bool = False,
+        reserved: int = ADMISSION_RESERVED,
+    ):
+        self.name = name
+        self.budget = budget
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout_s = queue_timeout_s
+        self.retry_after_s = retry_after_s
+        self.borrow = borrow
+        self.borrow_limit = budget.size if borrow else max_concurrent
+        self.reserved = min(reserved, max_concurrent)
+        self.in_flight = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.admitted_total = 0
+        self.shed_total = 0
+        self.shed_by_reason = {"queue_full": 0, "queue_timeout": 0}
+
+    def _shed(self, reason: str):
+        self.shed_total += 1
+        self.shed_by_reason[reason] += 1
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "code": "SERVICE_OVERLOADED",
+                "message": "Too many concurrent takedown requests, please retry shortly",
+                "endpoint": self.name,
+                "retry_after_seconds": self.retry_after_s,
+            },
+            headers={"Retry-After": str(self.retry_after_s)},
+        )
+
+    @asynccontextmanager
+    async def admit(self):
+        """Hold a connection from the budget for the duration of the block or raise 503"""
+        if not self.budget.try_acquire(self):
+            if self.queued >= self.max_queue:
+                self._shed("queue_full")
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+            waiter = self.budget.enqueue(self)
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter), timeout=self.queue_timeout_s)
+            except asyncio.TimeoutError:
+                if not waiter.done():
+                    self.budget.withdraw(self, waiter)
+                    self._shed("queue_timeout")
+            except asyncio.CancelledError:
+                self.budget.withdraw(self, waiter)
+                raise
+            finally:
+                self.queued -= 1
+
+        self.admitted_total += 1
+        try:
+            yield
+        finally:
+            self.budget.release(self)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current gauges and counters (export these to Prometheus if available)"""
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "max_concurrent": self.max_concurrent,
+            "borrowed": max(0, self.in_flight - self.max_concurrent),
+            "max_queue": self.max_queue,
+            "admitted_total": self.admitted_total,
+            "shed_total": self.shed_total,
+            "shed_by_reason": dict(self.shed_by_reason),
+        }
+
+
+def _allocate_pool_budget(budget: int, weights: Dict[str, int]) -> Dict[str, int]:
+    """Split the pool budget by weight (largest remainder, at least 1 each)"""
+    total_weight = sum(weights.values())
+    exact = {name: budget * weight / total_weight for name, weight in weights.items()}
+    allocation = {name: max(1, int(share)) for name, share in exact.items()}
+    spare = budget - sum(allocation.values())
+    for name in sorted(exact, key=lambda name: exact[name] - int(exact[name]), reverse=True)[:max(spare, 0)]:
+        allocation[name] += 1
+    return allocation
+
+
+def _build_admission_limiters(
+    limits: Dict[str, Dict[str, Any]],
+    pool_budget: int = TAKEDOWN_POOL_BUDGET,
+) -> Dict[str, AdmissionLimiter]:
+    """Build limiters sharing one PoolBudget, each with its weighted share of it"""
+    allocation = _allocate_pool_budget(
+        pool_budget, {name: config["pool_weight"] for name, config in limits.items()}
+    )
+    if sum(allocation.values()) > pool_budget:
+        raise ValueError(
+            f"Takedown admission limits need {sum(allocation.values())} connections "
+            f"but the pool budget is {pool_budget}"
+        )
+
+    budget = PoolBudget(pool_budget)
+    return {
+        name: AdmissionLimiter(
+            name,
+            budget,
+            max_concurrent=allocation[name],
+            **{key: value for key, value in config.items() if key != "pool_weight"},
+        )
+        for name, config in limits.items()
+    }
+
+
+_ADMISSION_LIMITERS = _build_admission_limiters(TAKEDOWN_ADMISSION_LIMITS)
+
+
+def admission(endpoint: str):
+    """Route dependency that admits the request through the endpoint's limiter"""
+    limiter = _ADMISSION_LIMITERS[endpoint]
+
+    async def _admit():
+        async with limiter.admit():
+            yield
+
+    return Depends(_admit)
+
+
+def admit(endpoint: str):
+    """
+    Context manager form of admission() for handlers that only use the DB for
+    part of the request, e.g. a lookup before streaming a file
+    """
+    return _ADMISSION_LIMITERS[endpoint].admit()
+
+
+# ========================================
+# Resolution Time Sketches
+# ========================================
+
+class ResolutionTimeSketch:
+    """
+    Log-bucketed duration histogram (DDSketch-style) with bounded relative error.
+
+    Bucket i holds durations in (GAMMA**(i-1), GAMMA**i] seconds. Sketches for
+    any mix of days, reason codes and vendors merge by adding bucket counts,
+    which is how takedown_resolution_histogram rows are combined in SQL.
+    """
+
+    RELATIVE_ACCURACY = 0.01
+    GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+    _LOG_GAMMA = math.log(GAMMA)
+
+    def __init__(self, buckets: Optional[Dict[int, int]] = None):
+        self.buckets: Dict[int, int] = dict(buckets or {})
+
+    @classmethod
+    def bucket_index(cls, seconds: float) -> int:
+        """Bucket for a duration; anything under a second lands in bucket 0"""
+        return math.ceil(math.log(max(seconds, 1.0)) / cls._LOG_GAMMA)
+
+    @classmethod
+    def bucket_value(cls, index: int) -> float:
+        """Representative duration (seconds) for a bucket"""
+        return 2 * cls.GAMMA ** index / (cls.GAMMA + 1)
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def add(self, seconds: float, count: int = 1):
+        self.add_bucket(self.bucket_index(seconds), count)
+
+    def add_bucket(self, index: int, count: int):
+        self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def merge(self, other: "ResolutionTimeSketch"):
+        for index, count in other.buckets.items():
+            self.add_bucket(index, count)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile in seconds, None when empty"""
+        total = self.count
+        if not total:
+            return None
+        rank = q * (total - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return self.bucket_value(index)
+        return self.bucket_value(max(self.buckets))
+
+    def mean(self) -> Optional[float]:
+        total = self.count
+        if not total:
+            return None
+        return sum(self.bucket_value(i) * c for i, c in self.buckets.items()) / total
+
+    def to_percentiles(self) -> DurationPercentiles:
+        def hours(seconds: Optional[float]) -> Optional[float]:
+            return round(seconds / 3600, 2) if seconds is not None else None
+
+        return DurationPercentiles(
+            count=self.count,
+            p50_hours=hours(self.quantile(0.50)),
+            p90_hours=hours(self.quantile(0.90)),
+            p99_hours=hours(self.quantile(0.99)),
+            mean_hours=hours(self.mean()),
+        )
+
+
+def _sketch_filters(
+    day_column: str,
+    from_date: Optional[date],
+    to_date: Optional[date],
+    reason_code: Optional[str],
+    vendor_id: Optional[str],
+):
+    """WHERE clause and params shared by the sketch table queries"""
+    filters = []
+    params: Dict[str, Any] = {}
+    if from_date:
+        filters.append(f"{day_column} >= :from_date")
+        params["from_date"] = from_date
+    if to_date:
+        filters.append(f"{day_column} <= :to_date")
+        params["to_date"] = to_date
+    if reason_code:
+        filters.append("reason_code = :reason_code")
+        params["reason_code"] = reason_code
+    if vendor_id:
+        filters.append("vendor_id = :vendor_id")
+        params["vendor_id"] = vendor_id
+    where = f"WHERE {' AND '.join(filters)}" if filters else ""
+    return where, params
+
+
+def load_resolution_sketch(
+    db: Session,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    reason_code: Optional[str] = None,
+    vendor_id: Optional[str] = None,
+) -> ResolutionTimeSketch:
+    """Merge per-day resolution histograms and uncompacted deltas for the range"""
+    where, params = _sketch_filters("day", from_date, to_date, reason_code, vendor_id)
+    rows = db.execute(
+        text(f"""
+            SELECT bucket, SUM(count) AS count
+            FROM (
+                SELECT day, reason_code, vendor_id, bucket, count FROM takedown_resolution_histogram
+                UNION ALL
+                SELECT day, reason_code, vendor_id, bucket, count FROM takedown_resolution_histogram_delta
+            ) AS histogram
+            {where}
+            GROUP BY bucket
+        """),
+        params,
+    )
+    return ResolutionTimeSketch({row.bucket: int(row.count) for row in rows})
+
+
+# Open counts are kept per creation hour, so open queue ages are within half
+# an hour of the truth (before the sketch's relative error)
+OPEN_QUEUE_AGE_ERROR_HOURS = 0.5
+
+
+def open_queue_hour_age(created_hour: datetime, now: datetime) -> float:
+    """Age in seconds at the midpoint of the part of created_hour before now"""
+    hour_end = min(created_hour + timedelta(hours=1), now)
+    return max((now - created_hour).total_seconds() - (hour_end - created_hour).total_seconds() / 2, 0.0)
+
+
+def load_open_queue_age_sketch(
+    db: Session,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    reason_code: Optional[str] = None,
+    vendor_id: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> ResolutionTimeSketch:
+    """Age of open requests from per-hour open counts (hour granularity)"""
+    now = now or datetime.utcnow()
+    where, params = _sketch_filters("CAST(created_hour AS DATE)", from_date, to_date, reason_code, vendor_id)
+    rows = db.execute(
+        text(f"""
+            SELECT created_hour, SUM(open_count) AS open_count
+            FROM (
+                SELECT created_hour, reason_code, vendor_id, open_count FROM takedown_open_queue
+                UNION ALL
+                SELECT created_hour, reason_code, vendor_id, open_count FROM takedown_open_queue_delta
+            ) AS open_queue
+            {where}
+            GROUP BY created_hour
+            HAVING SUM(open_count) > 0
+        """),
+        params,
+    )
+    sketch = ResolutionTimeSketch()
+    for row in rows:
+        sketch.add(open_queue_hour_age(row.created_hour, now), int(row.open_count))
+    return sketch
+
+
+def record_takedown_resolution(
+    db: Session,
+    created_at: datetime,
+    resolved_at: datetime,
+    reason_code: str,
+    vendor_id: str,
+):
+    """
+    Append one resolution to the histogram delta table inside the resolve transaction.
+
+    A plain INSERT locks no shared rows, so resolves for the same (day, reason,
+    vendor) during a moderation drive don't queue behind each other;
+    compact_takedown_sketches folds the deltas into the sketch tables later.
+    Open queue counts are kept by triggers on review_takedown_requests
+    (insert, status change and delete), not here.
+    """
+    db.execute(
+        text("""
+            INSERT INTO takedown_resolution_histogram_delta (day, reason_code, vendor_id, bucket, count)
+            VALUES (:day, :reason_code, :vendor_id, :bucket, 1)
+        """),
+        {
+            "day": resolved_at.date(),
+            "reason_code": reason_code,
+            "vendor_id": vendor_id,
+            "bucket": ResolutionTimeSketch.bucket_index((resolved_at - created_at).total_seconds()),
+        },
+    )
+
+
+def compact_takedown_sketches(db: Session):
+    """
+    Fold committed sketch deltas into the sketch tables.
+
+    Run every minute from the scheduler (or pg_cron, see the migration);
+    concurrent runs skip instead of waiting.
+    """
+    db.execute(text("SELECT compact_takedown_sketches()"))
+    db.commit()
+
+
+def backfill_resolution_histogram(db: Session, batch_size: int = 5000):
+    """One-off full scan to seed takedown_resolution_histogram from resolved rows"""
+    counts: Dict[tuple, int] = {}
+    rows = db.execute(
+        text("""
+            SELECT created_at, resolved_at, reason_code, vendor_id
+            FROM review_takedown_requests
+            WHERE resolved_at IS NOT NULL
+        """).execution_options(yield_per=batch_size)
+    )
+    for row in rows:
+        bucket = ResolutionTimeSketch.bucket_index((row.resolved_at - row.created_at).total_seconds())
+        key = (row.resolved_at.date(), row.reason_code, row.vendor_id, bucket)
+        counts[key] = counts.get(key, 0) + 1
+
+    db.execute(text("DELETE FROM takedown_resolution_histogram"))
+    db.execute(text("DELETE FROM takedown_resolution_histogram_delta"))
+    if counts:
+        db.execute(
+            text("""
+                INSERT INTO takedown_resolution_histogram (day, reason_code, vendor_id, bucket, count)
+                VALUES (:day, :reason_code, :vendor_id, :bucket, :count)
+            """),
+            [
+                {"day": day, "reason_code": reason, "vendor_id": vendor, "bucket": bucket, "count": count}
+                for (day, reason, vendor, bucket), count in counts.items()
+            ],
+        )
+    db.commit()
+
+
+# ========================================
+# Evidence Media Pipeline
+# ========================================
+
+# Evidence files live under <root>/<request_id>/<evidence_id>/ as "original"
+# and "thumbnail.jpg"; the evidence item in the DB is the source of truth for
+# which files belong to a request and their content type. Swap for object
+# storage in production (S3/GCS serve Range requests natively).
+EVIDENCE_STORAGE_ROOT = Path(os.environ.get("TAKEDOWN_EVIDENCE_DIR", "/var/lib/appydex/takedown-evidence"))
+EVIDENCE_URL_PREFIX = "/api/v1/admin/reviews/takedown-requests"
+EVIDENCE_MAX_BYTES = 25 * 1024 * 1024
+# Whole multipart body: the file plus boundaries, part headers and description
+EVIDENCE_MAX_BODY_BYTES = EVIDENCE_MAX_BYTES + 64 * 1024
+EVIDENCE_CHUNK_BYTES = 64 * 1024
+EVIDENCE_THUMBNAIL_SIZE = (320, 320)
+EVIDENCE_SUMMARY_THUMBNAILS = 4
+EVIDENCE_PROCESS_WORKERS = 2
+
+# Served inline with their own type. Anything else (HTML, SVG, text, ...) is
+# sent as an octet-stream download so an upload never renders as a page on the
+# admin API origin.
+EVIDENCE_INLINE_TYPES = frozenset({"image/jpeg", "image/png", "image/gif", "image/webp", "application/pdf"})
+
+_evidence_pool: Optional[ProcessPoolExecutor] = None
+_evidence_tasks: set = set()
+
+
+def evidence_dir(request_id: UUID, evidence_id: UUID) -> Path:
+    return EVIDENCE_STORAGE_ROOT / str(request_id) / str(evidence_id)
+
+
+def evidence_urls(request_id: UUID, evidence_id: UUID) -> Tuple[str, str]:
+    """Content and thumbnail URLs served by this router"""
+    base = f"{EVIDENCE_URL_PREFIX}/{request_id}/evidence/{evidence_id}"
+    return f"{base}/content", f"{base}/thumbnail"
+
+
+def summarize_evidence(items: List[Evidence]) -> EvidenceSummary:
+    """Counts and first few thumbnails, stored alongside the evidence array"""
+    return EvidenceSummary(
+        total=len(items),
+        images=sum(1 for item in items if item.type == "image"),
+        documents=sum(1 for item in items if item.type == "document"),
+        texts=sum(1 for item in items if item.type == "text"),
+        total_size_bytes=sum(item.size_bytes or 0 for item in items),
+        thumbnail_urls=[item.thumbnail_url for item in items if item.thumbnail_url][:EVIDENCE_SUMMARY_THUMBNAILS],
+    )
+
+
+def upload_content_type(file: UploadFile) -> str:
+    """Declared type of an upload without parameters, guessed from the name if missing"""
+    declared = (file.content_type or "").split(";")[0].strip().lower()
+    return declared or mimetypes.guess_type(file.filename or "")[0] or "application/octet-stream"
+
+
+def write_evidence_file(source, directory: Path) -> int:
+    """Copy an upload to storage in chunks; returns size or raises ValueError if too large"""
+    directory.mkdir(parents=True, exist_ok=True)
+    size = 0
+    with open(directory / "original", "wb") as out:
+        while chunk := source.read(EVIDENCE_CHUNK_BYTES):
+            size += len(chunk)
+            if size > EVIDENCE_MAX_BYTES:
+                raise ValueError("evidence file too large")
+            out.write(chunk)
+    return size
+
+
+async def store_evidence_upload(file: UploadFile, directory: Path) -> int:
+    """
+    Write an upload to storage off the event loop. On failure the partial
+    files are removed and the error is raised as 413 (too large) or 500.
+    """
+    try:
+        return await asyncio.to_thread(write_evidence_file, file.file, directory)
+    except ValueError:
+        shutil.rmtree(directory, ignore_errors=True)
+        raise _evidence_too_large()
+    except OSError as e:
+        shutil.rmtree(directory, ignore_errors=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "EVIDENCE_STORAGE_FAILED",
+                "message": "Failed to store evidence file",
+                "error": str(e)
+            }
+        )
+
+
+def _evidence_too_large():
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail={
+            "code": "EVIDENCE_TOO_LARGE",
+            "message": "Evidence file exceeds the upload limit",
+            "max_bytes": EVIDENCE_MAX_BYTES
+        }
+    )
+
+
+def evidence_content_headers(content_type: Optional[str], filename: Optional[str]) -> Tuple[str, Dict[str, str]]:
+    """Media type and headers for serving stored evidence (see EVIDENCE_INLINE_TYPES)"""
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    disposition = "inline"
+    if media_type not in EVIDENCE_INLINE_TYPES:
+        media_type = "application/octet-stream"
+        disposition = "attachment"
+    if filename:
+        disposition += f"; filename*=UTF-8''{quote(filename, safe='')}"
+    return media_type, {"Content-Disposition": disposition, "X-Content-Type-Options": "nosniff"}
+
+
+def generate_evidence_derivatives(directory: str, content_type: str) -> Dict[str, Any]:
+    """
+    Thumbnail and metadata for one evidence file. Runs in the process pool,
+    so it only takes and returns picklable values.
+
+    Pillow (images) and pypdf (PDF page counts) are optional; without them
+    the file is still served, just without a thumbnail or page count.
+    """
+    original = Path(directory) / "original"
+    result: Dict[str, Any] = {"size_bytes": original.stat().st_size}
+    if content_type.startswith("image/"):
+        try:
+            from PIL import Image
+        except ImportError:
+            return result
+        with Image.open(original) as image:
+            result["width"], result["height"] = image.size
+            image.thumbnail(EVIDENCE_THUMBNAIL_SIZE)
+            image.convert("RGB").save(Path(directory) / "thumbnail.jpg", "JPEG", quality=80, optimize=True)
+        result["has_thumbnail"] = True
+    elif content_type == "application/pdf":
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            return result
+        result["page_count"] = len(PdfReader(str(original)).pages)
+    return result
+
+
+def get_evidence_pool() -> ProcessPoolExecutor:
+    """
+    Lazily created pool for generate_evidence_derivatives. By then the worker
+    already runs threads (asyncio.to_thread, the server's executor), and
+    forking a threaded process can copy locks held by other threads, so
+    children come from a forkserver instead.
+    """
+    global _evidence_pool
+    if _evidence_pool is None:
+        _evidence_pool = ProcessPoolExecutor(
+            max_workers=EVIDENCE_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _evidence_pool
+
+
+async def shutdown_evidence_pool():
+    global _evidence_pool
+    if _evidence_tasks:
+        await asyncio.gather(*_evidence_tasks, return_exceptions=True)
+    if _evidence_pool is not None:
+        _evidence_pool.shutdown(wait=True)
+        _evidence_pool = None
+
+
+router.add_event_handler("shutdown", shutdown_evidence_pool)
+
+
+async def process_evidence(
+    session_factory: Callable[[], Session], request_id: UUID, evidence_id: UUID, content_type: str
+) -> Dict[str, Any]:
+    """Generate derivatives off the event loop and record them on the evidence item"""
+    loop = asyncio.get_running_loop()
+    try:
+        changes = await loop.run_in_executor(
+            get_evidence_pool(),
+            generate_evidence_derivatives,
+            str(evidence_dir(request_id, evidence_id)),
+            content_type,
+        )
+        changes["processing_status"] = "ready"
+        if changes.pop("has_thumbnail", False):
+            changes["thumbnail_url"] = evidence_urls(request_id, evidence_id)[1]
+    except Exception:
+        changes = {"processing_status": "failed"}
+
+    def record():
+        with session_factory() as db:
+            update_evidence_items(
+                db, request_id, lambda items: apply_evidence_changes(items, str(evidence_id), changes)
+            )
+
+    await asyncio.to_thread(record)
+    return changes
+
+
+def schedule_evidence_processing(
+    session_factory: Callable[[], Session], request_id: UUID, evidence_id: UUID, content_type: str
+) -> asyncio.Task:
+    """Start processing in the background; the task is kept alive until done"""
+    task = asyncio.create_task(process_evidence(session_factory, request_id, evidence_id, content_type))
+    _evidence_tasks.add(task)
+    task.add_done_callback(_evidence_tasks.discard)
+    return task
+
+
+def apply_evidence_changes(items: List[Evidence], evidence_id: str, changes: Dict[str, Any]):
+    """Replace the matching evidence item with one carrying the processing results"""
+    for index, item in enumerate(items):
+        if item.id == evidence_id:
+            items[index] = item.copy(update=changes)
+
+
+def update_evidence_items(db: Session, request_id: UUID, update: Callable[[List[Evidence]], Any]) -> bool:
+    """Read-modify-write the evidence array and its summary under a row lock"""
+    row = db.execute(
+        text("SELECT evidence FROM review_takedown_requests WHERE id = :id FOR UPDATE"),
+        {"id": request_id},
+    ).first()
+    if row is None:
+        return False
+    items = [Evidence(**item) for item in row.evidence or []]
+    update(items)
+    db.execute(
+        text("""
+            UPDATE review_takedown_requests
+            SET evidence = CAST(:evidence AS JSONB),
+                evidence_summary = CAST(:evidence_summary AS JSONB),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = :id
+        """),
+        {
+            "id": request_id,
+            "evidence": json.dumps(jsonable_encoder(items, exclude_none=True)),
+            "evidence_summary": json.dumps(jsonable_encoder(summarize_evidence(items))),
+        },
+    )
+    db.commit()
+    return True
+
+
+def find_evidence_item(db: Session, request_id: UUID, evidence_id: UUID) -> Optional[Evidence]:
+    """The evidence item with this id on this request, or None"""
+    item = db.execute(
+        text("""
+            SELECT e.item
+            FROM review_takedown_requests r
+            CROSS JOIN LATERAL jsonb_array_elements(COALESCE(r.evidence, '[]'::JSONB)) AS e(item)
+            WHERE r.id = :id AND e.item->>'id' = :evidence_id
+        """),
+        {"id": request_id, "evidence_id": str(evidence_id)},
+    ).scalar()
+    return Evidence(**item) if item is not None else None
+
+
+def load_evidence_page(
+    db: Session, request_id: UUID, page: int, page_size: int
+) -> Optional[Tuple[List[Evidence], int]]:
+    """One page of the evidence array without sending the rest; None if no such request"""
+    row = db.execute(
+        text("""
+            SELECT COALESCE(jsonb_array_length(evidence), 0) AS total
+            FROM review_takedown_requests
+            WHERE id = :id
+        """),
+        {"id": request_id},
+    ).first()
+    if row is None:
+        return None
+    items = db.execute(
+        text("""
+            SELECT e.item
+            FROM review_takedown_requests r
+            CROSS JOIN LATERAL jsonb_array_elements(COALESCE(r.evidence, '[]'::JSONB))
+              WITH ORDINALITY AS e(item, position)
+            WHERE r.id = :id
+            ORDER BY e.position
+            OFFSET :offset LIMIT :limit
+        """),
+        {"id": request_id, "offset": (page - 1) * page_size, "limit": page_size},
+    ).scalars()
+    return [Evidence(**item) for item in items], row.total
+
+
+def backfill_evidence_summaries(db: Session, batch_size: int = 500):
+    """One-off: fill evidence_summary for rows created before the column existed"""
+    while True:
+        rows = db.execute(
+            text("""
+                SELECT id, evidence FROM review_takedown_requests
+                WHERE evidence_summary IS NULL
+                LIMIT :limit
+            """),
+            {"limit": batch_size},
+        ).all()
+        if not rows:
+            break
+        db.execute(
+            text("UPDATE review_takedown_requests SET evidence_summary = CAST(:summary AS JSONB) WHERE id = :id"),
+            [
+                {
+                    "id": row.id,
+                    "summary": json.dumps(jsonable_encoder(
+                        summarize_evidence([Evidence(**item) for item in row.evidence or []])
+                    )),
+                }
+                for row in rows
+            ],
+        )
+        db.commit()
+
+
+def parse_range_header(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Inclusive byte range for a single-range "bytes=" header, or None to send
+    the whole file (no header, other units, multiple ranges, malformed, or
+    last position before the first, which RFC 9110 says to ignore).
+    Raises 416 when the range starts past the end of the file.
+    """
+    if not range_header:
+        return None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_text, _, end_text = spec.strip().partition("-")
+    try:
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+        else:
+            start = max(size - int(end_text), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    if start_text and end_text and end < start:
+        return None
+    if start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail={
+                "code": "RANGE_NOT_SATISFIABLE",
+                "message": "Requested range is outside the evidence file",
+                "size_bytes": size
+            },
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, min(end, size - 1)
+
+
+def iter_file_range(path: Path, start: int, end: int) -> Iterator[bytes]:
+    with open(path, "rb") as source:
+        source.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = source.read(min(EVIDENCE_CHUNK_BYTES, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def stream_evidence_file(request_id: UUID, item: Evidence, range_header: Optional[str]) -> StreamingResponse:
+    """
+    Whole stored file or a single byte range of it, for an item already checked
+    to belong to the request. Byte ranges refer to the stored bytes, which is why
+    install_response_compression skips this route.
+    """
+    original = evidence_dir(request_id, UUID(item.id)) / "original"
+    if not original.is_file():
+        raise _evidence_not_found(request_id, UUID(item.id))
+
+    size = original.stat().st_size
+    byte_range = parse_range_header(range_header, size)
+    start, end = byte_range or (0, size - 1)
+    media_type, headers = evidence_content_headers(item.content_type, item.filename)
+    headers.update({
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, max-age=3600",
+        "Content-Length": str(end - start + 1),
+    })
+    if byte_range:
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    return StreamingResponse(
+        iter_file_range(original, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+def _evidence_not_found(request_id: UUID, evidence_id: UUID):
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "code": "EVIDENCE_NOT_FOUND",
+            "message": "Evidence file not found",
+            "request_id": str(request_id),
+            "evidence_id": str(evidence_id)
+        }
+    )
+
+
+# ========================================
+# Worker Warm-up
+# ========================================
+# Run once per worker from a startup handler (install_takedown_warmup) or a
+# lifespan (await warm_up_takedown_router). The readiness endpoint returns
+# 503 until the in-process steps have finished, so autoscaled workers only take
+# traffic warm. Pool pre-fill is reported separately and retried with backoff,
+# so a brief DB outage at boot doesn't keep the worker unready.
+
+# Connections to open during warm-up when the engine pool has no fixed size
+WARMUP_POOL_SIZE = 5
+# Pool pre-fill attempts before the worker reports ready without it; after
+# that it keeps retrying in the background, doubling the delay up to the cap
+WARMUP_POOL_STARTUP_ATTEMPTS = 3
+WARMUP_POOL_RETRY_INITIAL_S = 0.5
+WARMUP_POOL_RETRY_MAX_S = 30.0
+
+_warmup_state: Dict[str, Any] = {
+    "ready": False,
+    "timings_ms": {},
+    "error": None,
+    "pool": {"status": "skipped", "attempts": 0, "error": None},
+}
+_warmup_tasks: set = set()
+
+_SAMPLE_WORDS = (
+    "late rude unfinished overcharged technician cleaning refund booking arrived "
+    "never again scam damaged floor carpet kitchen estimate hours manager call"
+).split()
+
+
+def _sample_takedown(index: int, vendor_count: int = 8, reviewer_count: int = 60) -> Dict[str, Any]:
+    """Synthetic list row; vendors and reviewers repeat across rows like a real page"""
+    rng = random.Random(index)
+    vendor = index % vendor_count
+    reviewer = index % reviewer_count
+    created = datetime(2025, 11, 1) + timedelta(hours=index)
+    return {
+        "id": str(UUID(int=index + 1)),
+        "request_number": f"TR-2025-{index + 1:06d}",
+        "status": "open",
+        "review": {
+            "id": str(UUID(int=10_000 + index)),
+            "rating": 1,
+            "title": " ".join(rng.choices(_SAMPLE_WORDS, k=5)).capitalize(),
+            "body": " ".join(rng.choices(_SAMPLE_WORDS, k=60)).capitalize() + ".",
+            "status": "published",
+            "created_at": created - timedelta(days=2),
+            "reviewer": {
+                "id": str(UUID(int=20_000 + reviewer)),
+                "name": f"Reviewer {reviewer}",
+                "email": f"reviewer{reviewer}@example.com",
+                "phone": "+15550100000",
+                "profile_image": f"https://cdn.appydex.example/users/{reviewer}.jpg",
+                "account_created_at": datetime(2024, 1, 1),
+                "total_reviews": 14,
+                "total_bookings": 3,
+                "trust_score": 35,
+                "risk_flags": ["new_account", "burst_reviews"],
+            },
+        },
+        "vendor": {
+            "id": str(UUID(int=30_000 + vendor)),
+            "name": f"vendor-{vendor}",
+            "display_name": f"Sparkle Home Services {vendor}",
+            "email": f"support{vendor}@vendor.example",
+            "phone": "+15550199999",
+            "logo": f"https://cdn.appydex.example/vendors/{vendor}.png",
+            "rating": 4.6,
+            "total_reviews": 812,
+            "total_takedown_requests": 41,
+            "accepted_takedowns": 12,
+            "rejected_takedowns": 20,
+        },
+        "reason_code": "defamation",
+        "reason_description": "Review contains false statements about the completed service.",
+        "evidence": [
+            {
+                "id": str(UUID(int=40_000 + index)),
+                "type": "image",
+                "url": f"https://cdn.appydex.example/evidence/{index}.jpg",
+                "thumbnail_url": f"https://cdn.appydex.example/evidence/{index}_thumb.jpg",
+                "filename": "completed_job.jpg",
+                "size_bytes": 482133,
+                "description": "Photo of completed job",
+                "uploaded_at": created,
+            }
+        ],
+        "vendor_notes": "Customer confirmed satisfaction on site.",
+        "priority": "high",
+        "created_at": created,
+    }
+
+
+def _sample_takedown_row(index: int, resolved: bool = False, **sample_options):
+    """_sample_takedown shaped like a loaded ORM row, for the row-to-model converters"""
+    item = _sample_takedown(index, **sample_options)
+    review, vendor = item.pop("review"), item.pop("vendor")
+    reviewer = review.pop("reviewer")
+    created = item["created_at"]
+    return SimpleNamespace(
+        **{**item, "id": UUID(item["id"]), "status": "accepted" if resolved else "open"},
+        evidence_summary=None,
+        resolved_at=created + timedelta(hours=6) if resolved else None,
+        resolved_by=(
+            SimpleNamespace(id=UUID(int=50_000), name="Admin", email="admin@appydex.example") if resolved else None
+        ),
+        decision="accept" if resolved else None,
+        action_taken="hide" if resolved else None,
+        resolution_reason="Warm-up sample" if resolved else None,
+        admin_notes=None,
+        review=SimpleNamespace(
+            **{**review, "id": UUID(review["id"])},
+            updated_at=None,
+            reviewer=SimpleNamespace(**{**reviewer, "id": UUID(reviewer["id"])}, created_at=reviewer["account_created_at"]),
+            booking=SimpleNamespace(
+                id=UUID(int=60_000 + index),
+                booking_number=f"BK-2025-{index + 1:06d}",
+                status="completed",
+                scheduled_at=created - timedelta(days=3),
+                completed_at=created - timedelta(days=3, hours=-2),
+                amount_cents=12_000,
+                payment_status="paid",
+                has_dispute=False,
+            ),
+        ),
+        vendor=SimpleNamespace(**{**vendor, "id": UUID(vendor["id"])}),
+    )
+
+
+def warm_up_models():
+    """
+    Run sample rows through the row-to-model converters, then push one sample
+    of every request and response body through the router's own route fields:
+    body params are validated the way FastAPI validates a request body, and
+    response fields run validate/serialize as FastAPI does for response_model.
+    """
+    rows = [_sample_takedown_row(0), _sample_takedown_row(1, resolved=True)]
+    meta = PaginationMeta(page=1, page_size=2, total_items=2, total_pages=1, has_next=False, has_prev=False)
+    detail = takedown_detail(
+        rows[1],
+        InternalAnalysis(user_behavior_flags=["new_account"]),
+        [TimelineEvent(event="takedown_requested", timestamp=rows[1].created_at, details="Warm-up sample")],
+    )
+    evidence = Evidence(**rows[0].evidence[0])
+    responses = {
+        "list_takedown_requests": [
+            build_takedown_list(rows, meta),
+            build_takedown_list_normalized(rows, meta, evidence_mode="summary"),
+        ],
+        "get_takedown_request": [TakedownDetailResponse(data=detail)],
+        "get_takedown_requests_batch": [
+            TakedownBatchResponse(data=[detail], meta={"requested": 1, "found": 1, "missing": []}),
+        ],
+        "upload_takedown_evidence": [EvidenceUploadResponse(data=evidence)],
+        "list_takedown_evidence": [EvidenceListResponse(data=[evidence], meta=meta)],
+        "resolve_takedown_request": [ResolveResponse(data={"request_id": rows[1].id, "status": "accepted"})],
+        "bulk_create_takedown_requests": [BulkCreateResponse(data={"created": [], "skipped": []})],
+        "get_resolution_analytics": [ResolutionAnalyticsResponse(data=ResolutionAnalytics(
+            resolution_time=ResolutionTimeSketch().to_percentiles(),
+            open_queue_age=DurationPercentiles(),
+            relative_accuracy=ResolutionTimeSketch.RELATIVE_ACCURACY,
+            open_queue_age_error_hours=OPEN_QUEUE_AGE_ERROR_HOURS,
+        ))],
+    }
+    bodies = {
+        "resolve_data": ResolveRequest(decision="accept", action="hide", reason="w" * 50),
+        "bulk_data": BulkCreateRequest(items=[
+            TakedownCreateItem(
+                review_id=UUID(int=10_000),
+                reason_code="defamation",
+                reason_description="Warm-up sample",
+                evidence=[evidence],
+            )
+        ]),
+    }
+
+    for route in router.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        for param in route.dependant.body_params:
+            if param.name in bodies:
+                _, errors = param.validate(jsonable_encoder(bodies[param.name]), {}, loc=("body",))
+                if errors:
+                    raise ValueError(f"{route.name} warm-up body: {errors}")
+        for sample in responses.get(route.name, []):
+            value, errors = route.response_field.validate(sample, {}, loc=("response",))
+            if errors:
+                raise ValueError(f"{route.name} warm-up response: {errors}")
+            route.response_field.serialize(value)
+
+
+def takedown_warmup_statements() -> List[Any]:
+    """
+    The list/detail/resolve statements from the endpoints' own factories, with
+    parameters that match no rows. Running them compiles the real statements
+    into the engine's compiled cache (the cache key ignores parameter values)
+    and loads the tables' catalog entries into each pooled backend.
+    selectinload's follow-up queries only run when rows come back, so the
+    batch path warms its base query only.
+    """
+    # TODO: Enable with the ORM models; until then pre-fill only opens connections
+    # nil_id = UUID(int=0)
+    # page = lambda query: query.offset(0).limit(25)
+    # return [
+    #     page(takedown_list_query()),
+    #     page(takedown_list_query(evidence_mode="summary")),
+    #     page(takedown_list_query(sort_by="priority")),
+    #     takedown_details_query([nil_id]),
+    #     takedown_details_query([nil_id, nil_id]),
+    #     takedown_resolve_query(nil_id),
+    # ]
+    
+    return []
+
+
+def prefill_connection_pool(engine, size: int, statements: Sequence[Any] = ()) -> int:
+    """
+    Open `size` pooled connections at once, run the warm-up statements on each
+    through an ORM Session (so the ORM compile path is the one cached) and
+    return them to the pool. Connections are held together so the pool has to
+    create `size` distinct ones rather than reusing the first.
+    """
+    connections = []
+
+    def open_connection():
+        connection = engine.connect()
+        connections.append(connection)
+        with Session(bind=connection) as session:
+            for statement in statements:
+                session.execute(statement).unique().all()
+
+    try:
+        # Connect in parallel: TLS and auth round trips dominate here
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            for future in [executor.submit(open_connection) for _ in range(size)]:
+                future.result()
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+async def prefill_pool_with_backoff(engine, size: int, max_attempts: Optional[int] = None) -> bool:
+    """
+    Retry prefill_connection_pool with exponential backoff, recording progress
+    in the readiness state. Gives up after max_attempts (None: until it succeeds).
+    """
+    pool_state = _warmup_state["pool"]
+    delay = WARMUP_POOL_RETRY_INITIAL_S
+    attempts = 0
+    while True:
+        attempts += 1
+        pool_state["attempts"] += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(prefill_connection_pool, engine, size, takedown_warmup_statements())
+        except Exception as exc:
+            pool_state.update(status="retrying", error=f"{type(exc).__name__}: {exc}")
+            if max_attempts is not None and attempts >= max_attempts:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARMUP_POOL_RETRY_MAX_S)
+            continue
+        _warmup_state["timings_ms"]["pool"] = round((time.perf_counter() - start) * 1000, 2)
+        pool_state.update(status="ready", error=None)
+        return True
+
+
+async def warm_up_request(app: FastAPI):
+    """
+    Send one in-process GET through the full ASGI stack so Starlette builds the
+    middleware stack and the routing/exception paths run before real traffic.
+    The readiness route answers 503 here, which is fine.
+    """
+    path = app.url_path_for("get_takedown_router_readiness")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"warmup"), (b"accept-encoding", b"gzip, br")],
+        "client": ("127.0.0.1", 0),
+        "server": ("warmup", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def warm_up_takedown_router(app: FastAPI, engine=None, pool_size: Optional[int] = None) -> Dict[str, float]:
+    """
+    Warm this worker before it reports ready: build and exercise the Pydantic
+    validators/serialisers, generate and cache the OpenAPI document, push one
+    request through the ASGI stack, and pre-fill the DB pool with connections
+    that have run the list/detail/resolve statements.
+
+    An error in the in-process steps is a bug and keeps the worker unready.
+    Pool pre-fill gets WARMUP_POOL_STARTUP_ATTEMPTS tries; if the DB is still
+    unreachable the worker reports ready anyway and keeps retrying in the
+    background, with progress under "pool" in the readiness response.
+    """
+    timings: Dict[str, float] = {}
+    _warmup_state.update(
+        ready=False,
+        timings_ms=timings,
+        error=None,
+        pool={"status": "skipped" if engine is None else "pending", "attempts": 0, "error": None},
+    )
+
+    def timed(name: str, fn: Callable, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        timings[name] = round((time.perf_counter() - start) * 1000, 2)
+        return result
+
+    try:
+        timed("models", warm_up_models)
+        # app.openapi() caches the schema on the app, so /openapi.json is free afterwards
+        timed("openapi", app.openapi)
+        start = time.perf_counter()
+        await warm_up_request(app)
+        timings["request"] = round((time.perf_counter() - start) * 1000, 2)
+    except Exception as exc:
+        _warmup_state["error"] = f"{type(exc).__name__}: {exc}"
+        return timings
+
+    if engine is not None:
+        size = pool_size or getattr(engine.pool, "size", lambda: WARMUP_POOL_SIZE)()
+        if not await prefill_pool_with_backoff(engine, size, WARMUP_POOL_STARTUP_ATTEMPTS):
+            task = asyncio.create_task(prefill_pool_with_backoff(engine, size))
+            _warmup_tasks.add(task)
+            task.add_done_callback(_warmup_tasks.discard)
+
+    _warmup_state["ready"] = True
+    return timings
+
+
+async def cancel_warmup_tasks():
+    """Stop background pool pre-fill retries"""
+    for task in list(_warmup_tasks):
+        task.cancel()
+    await asyncio.gather(*_warmup_tasks, return_exceptions=True)
+
+
+def install_takedown_warmup(app: FastAPI, engine=None, pool_size: Optional[int] = None):
+    """Run warm_up_takedown_router on app startup (call once from main.py)"""
+    async def warm_up():
+        await warm_up_takedown_router(app, engine, pool_size)
+
+    app.router.add_event_handler("startup", warm_up)
+    app.router.add_event_handler("shutdown", cancel_warmup_tasks)
+
+
 # ========================================
 # Endpoint Implementations
 # ========================================
 
 @router.get(
     "/reviews/takedown-requests",
-    response_model=TakedownListResponse,
+    response_model=TakedownListAnyResponse,
     summary="List Review Takedown Requests",
     description="Get paginated list of vendor takedown requests with filtering",
     responses={
         200: {"description": "Success"},
         403: {"description": "Permission denied", "model": ErrorResponse},
-    }
+        503: {"description": "Overloaded, retry after Retry-After seconds", "model": ErrorResponse},
+    },
+    dependencies=[admission("list")],
 )
 async def list_takedown_requests(
     page: int = Query(1, ge=1, description="Page number"),
@@ -249,6 +1673,8 @@ async def list_takedown_requests(
     to_date: Optional[datetime] = Query(None, description="Filter to date"),
     sort_by: Literal["created_at", "priority"] = Query("created_at", description="Sort field"),
     sort_order: Literal["asc", "desc"] = Query("desc", description="Sort order"),
+    evidence_mode: Literal["full", "summary"] = Query("full", description="Inline evidence or counts and thumbnails only"),
+    shape: Literal["nested", "normalized"] = Query("nested", description="Nested objects or vendor/reviewer side tables"),
     # db: Session = Depends(get_db),
     # current_admin = Depends(get_current_admin_user),
 ):
@@ -256,6 +1682,7 @@ async def list_takedown_requests(
     List all vendor takedown requests with comprehensive filtering.
     
     **Permissions Required:** reviews:moderate OR super_admin
+    **Load Shedding:** 503 + Retry-After when the list queue is full or resolve has requests waiting
     
     **Query Parameters:**
     - page: Page number (default: 1)
@@ -266,6 +1693,11 @@ async def list_takedown_requests(
     - from_date/to_date: Date range filter
     - sort_by: Sort by created_at or priority
     - sort_order: asc or desc
+    - evidence_mode: "full" inlines evidence; "summary" returns evidence_summary
+      (counts and thumbnail URLs) and leaves evidence empty
+    - shape: "nested" (default) embeds vendor and reviewer in every row;
+      "normalized" returns each vendor/reviewer once in `vendors`/`reviewers`
+      keyed by id, with rows carrying vendor_id and review.reviewer_id
     
     **Returns:**
     - Paginated list of takedown requests
@@ -276,47 +1708,11 @@ async def list_takedown_requests(
     # TODO: Check permissions
     # check_permission(current_admin, "reviews:moderate")
     
-    # Build query
-    # query = select(ReviewTakedownRequest).options(
-    #     joinedload(ReviewTakedownRequest.review).joinedload(Review.reviewer),
-    #     joinedload(ReviewTakedownRequest.vendor),
-    #     joinedload(ReviewTakedownRequest.resolved_by)
+    # Build query (same factory warm-up compiles)
+    # query = takedown_list_query(
+    #     status, reason_code, vendor_id, from_date, to_date, sort_by, sort_order, evidence_mode
     # )
     
-    # Apply filters
-    # filters = []
-    # if status:
-    #     filters.append(ReviewTakedownRequest.status == status)
-    # if reason_code:
-    #     filters.append(ReviewTakedownRequest.reason_code == reason_code)
-    # if vendor_id:
-    #     filters.append(ReviewTakedownRequest.vendor_id == vendor_id)
-    # if from_date:
-    #     filters.append(ReviewTakedownRequest.created_at >= from_date)
-    # if to_date:
-    #     filters.append(ReviewTakedownRequest.created_at <= to_date)
-    
-    # if filters:
-    #     query = query.where(and_(*filters))
-    
-    # Apply sorting
-    # if sort_by == "priority":
-    #     # Sort: high -> medium -> low, then by created_at
-    #     priority_order = case(
-    #         (ReviewTakedownRequest.priority == "high", 1),
-    #         (ReviewTakedownRequest.priority == "medium", 2),
-    #         (ReviewTakedownRequest.priority == "low", 3),
-    #     )
-    #     if sort_order == "desc":
-    #         query = query.order_by(priority_order.desc(), ReviewTakedownRequest.created_at.desc())
-    #     else:
-    #         query = query.order_by(priority_order, ReviewTakedownRequest.created_at)
-    # else:
-    #     if sort_order == "desc":
-    #         query = query.order_by(ReviewTakedownRequest.created_at.desc())
-    #     else:
-    #         query = query.order_by(ReviewTakedownRequest.created_at)
-    
     # Get total count
     # count_query = select(func.count()).select_from(query.subquery())
     # total_items = db.scalar(count_query)
@@ -333,24 +1729,27 @@ async def list_takedown_requests(
     
     # TODO: Replace with actual database query
     # Mock response for demonstration
-    return TakedownListResponse(
-        success=True,
-        data=[],  # Convert results to TakedownRequestList
-        meta=PaginationMeta(
-            page=page,
-            page_size=page_size,
-            total_items=0,  # Replace with actual count
-            total_pages=0,
-            has_next=False,
-            has_prev=False,
-            summary={
-                "open": 0,
-                "accepted": 0,
-                "rejected": 0,
-                "avg_resolution_time_hours": 0.0
-            }
-        )
+    results = []
+    meta = PaginationMeta(
+        page=page,
+        page_size=page_size,
+        total_items=0,  # Replace with actual count
+        total_pages=0,
+        has_next=False,
+        has_prev=False,
+        summary={
+            "open": 0,
+            "accepted": 0,
+            "rejected": 0,
+            "avg_resolution_time_hours": 0.0
+        }
     )
+    
+    # Convert results; evidence_summary is always included, evidence only in full mode.
+    # The normalized shape builds each vendor/reviewer model once, not once per row.
+    if shape == "normalized":
+        return build_takedown_list_normalized(results, meta, evidence_mode)
+    return build_takedown_list(results, meta, evidence_mode)
 
 
 @router.get(
@@ -362,7 +1761,9 @@ async def list_takedown_requests(
         200: {"description": "Success"},
         403: {"description": "Permission denied", "model": ErrorResponse},
         404: {"description": "Request not found", "model": ErrorResponse},
-    }
+        503: {"description": "Overloaded, retry after Retry-After seconds", "model": ErrorResponse},
+    },
+    dependencies=[admission("detail")],
 )
 async def get_takedown_request(
     request_id: UUID,
@@ -373,6 +1774,7 @@ async def get_takedown_request(
     Get detailed information about a specific takedown request.
     
     **Permissions Required:** reviews:moderate OR super_admin
+    **Load Shedding:** 503 + Retry-After when the detail queue is full or resolve has requests waiting
     
     **Path Parameters:**
     - request_id: UUID of the takedown request
@@ -390,17 +1792,10 @@ async def get_takedown_request(
     # TODO: Check permissions
     # check_permission(current_admin, "reviews:moderate")
     
-    # Query request with all relationships
-    # query = select(ReviewTakedownRequest).options(
-    #     joinedload(ReviewTakedownRequest.review).joinedload(Review.reviewer),
-    #     joinedload(ReviewTakedownRequest.review).joinedload(Review.booking),
-    #     joinedload(ReviewTakedownRequest.vendor),
-    #     joinedload(ReviewTakedownRequest.resolved_by)
-    # ).where(ReviewTakedownRequest.id == request_id)
+    # Same loader as the batch endpoint, with a single id
+    # details = load_takedown_details(db, [request_id])
     
-    # result = db.execute(query).scalar_one_or_none()
-    
-    # if not result:
+    # if request_id not in details:
     #     raise HTTPException(
     #         status_code=status.HTTP_404_NOT_FOUND,
     #         detail={
@@ -410,13 +1805,161 @@ async def get_takedown_request(
     #         }
     #     )
     
-    # Get internal analysis
-    # analysis = generate_internal_analysis(result, db)
+    # return TakedownDetailResponse(success=True, data=details[request_id])
+    
+    # TODO: Replace with actual data
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "code": "REQUEST_NOT_FOUND",
+            "message": "Takedown request not found",
+            "request_id": str(request_id)
+        }
+    )
+
+
+@router.get(
+    "/reviews/takedown-requests:batch",
+    response_model=TakedownBatchResponse,
+    summary="Get Takedown Request Details (Batch)",
+    description="Get complete information about up to 50 takedown requests in one call",
+    responses={
+        200: {"description": "Success"},
+        400: {"description": "Invalid or too many ids", "model": ErrorResponse},
+        403: {"description": "Permission denied", "model": ErrorResponse},
+        503: {"description": "Overloaded, retry after Retry-After seconds", "model": ErrorResponse},
+    },
+    dependencies=[admission("batch_detail")],
+)
+async def get_takedown_requests_batch(
+    ids: List[str] = Query(..., description="Request UUIDs, repeated or comma-separated"),
+    # db: Session = Depends(get_db),
+    # current_admin = Depends(get_current_admin_user),
+):
+    """
+    Get detailed information about several takedown requests at once, so the
+    admin app can prefetch the next page of details in one round-trip.
+    
+    **Permissions Required:** reviews:moderate OR super_admin
+    
+    **Query Parameters:**
+    - ids: Up to 50 request UUIDs (`?ids=a&ids=b` or `?ids=a,b`); duplicates are ignored
+    
+    **Returns:**
+    - data: TakedownRequestDetail for each found id, in request order
+    - meta: requested and found counts, plus ids that were not found (no 404)
+    
+    Reviews, bookings, vendors, analysis and timelines are loaded with one
+    set-based query each rather than once per request.
+    """
+    
+    # TODO: Check permissions
+    # check_permission(current_admin, "reviews:moderate")
+    
+    request_ids = parse_batch_ids(ids)
     
-    # Get timeline
-    # timeline = generate_timeline(result, db)
+    # details = load_takedown_details(db, request_ids)
     
     # TODO: Replace with actual data
+    details: Dict[UUID, TakedownRequestDetail] = {}
+    
+    return TakedownBatchResponse(
+        success=True,
+        data=[details[request_id] for request_id in request_ids if request_id in details],
+        meta={
+            "requested": len(request_ids),
+            "found": len(details),
+            "missing": [str(request_id) for request_id in request_ids if request_id not in details],
+        },
+    )
+
+
+@router.post(
+    "/reviews/takedown-requests/{request_id}/evidence",
+    response_model=EvidenceUploadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Upload Takedown Evidence",
+    description="Store an evidence file and generate its thumbnail/metadata in the background",
+    responses={
+        202: {"description": "Stored; thumbnail and metadata pending"},
+        403: {"description": "Permission denied", "model": ErrorResponse},
+        404: {"description": "Request not found", "model": ErrorResponse},
+        413: {"description": "File too large", "model": ErrorResponse},
+        500: {"description": "Evidence storage failed", "model": ErrorResponse},
+        503: {"description": "Overloaded, retry after Retry-After seconds", "model": ErrorResponse},
+    },
+    dependencies=[admission("evidence")],
+)
+async def upload_takedown_evidence(
+    request_id: UUID,
+    file: UploadFile = File(..., description="Image or document, max 25 MB"),
+    description: str = Form(..., min_length=1, max_length=2000),
+    # db: Session = Depends(get_db),
+    # current_admin = Depends(get_current_admin_user),
+):
+    """
+    Upload an evidence file for a takedown request.
+    
+    **Permissions Required:** reviews:moderate OR super_admin
+    
+    **Process:**
+    1. Bodies over EVIDENCE_MAX_BODY_BYTES are rejected with 413 before parsing
+       (install_evidence_upload_limit); the rest is spooled by Starlette and
+       copied to evidence storage off the event loop (max EVIDENCE_MAX_BYTES)
+    2. Append the evidence item with processing_status "pending"
+    3. Return 202 immediately
+    4. A process pool generates the thumbnail (images) and metadata
+       (dimensions, PDF page count), then marks the item "ready"
+    """
+    
+    # TODO: Check permissions
+    # check_permission(current_admin, "reviews:moderate")
+    
+    # if not db.scalar(select(ReviewTakedownRequest.id).where(ReviewTakedownRequest.id == request_id)):
+    #     raise HTTPException(
+    #         status_code=status.HTTP_404_NOT_FOUND,
+    #         detail={
+    #             "code": "REQUEST_NOT_FOUND",
+    #             "message": "Takedown request not found",
+    #             "request_id": str(request_id)
+    #         }
+    #     )
+    
+    # content_type = upload_content_type(file)
+    # evidence_id = uuid4()
+    # directory = evidence_dir(request_id, evidence_id)
+    # size_bytes = await store_evidence_upload(file, directory)
+    
+    # evidence = Evidence(
+    #     id=str(evidence_id),
+    #     type="image" if content_type.startswith("image/") else "document",
+    #     url=evidence_urls(request_id, evidence_id)[0],
+    #     filename=file.filename,
+    #     size_bytes=size_bytes,
+    #     description=description,
+    #     uploaded_at=datetime.utcnow(),
+    #     content_type=content_type,
+    #     processing_status="pending",
+    # )
+    
+    # if not update_evidence_items(db, request_id, lambda items: items.append(evidence)):
+    #     # Request deleted since the check above
+    #     shutil.rmtree(directory, ignore_errors=True)
+    #     raise HTTPException(
+    #         status_code=status.HTTP_404_NOT_FOUND,
+    #         detail={
+    #             "code": "REQUEST_NOT_FOUND",
+    #             "message": "Takedown request not found",
+    #             "request_id": str(request_id)
+    #         }
+    #     )
+    
+    # Marks the item "ready" (or "failed") once derivatives are generated
+    # schedule_evidence_processing(SessionLocal, request_id, evidence_id, content_type)
+    
+    # return EvidenceUploadResponse(success=True, data=evidence)
+    
+    # TODO: Replace with actual implementation
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
         detail={
@@ -427,6 +1970,163 @@ async def get_takedown_request(
     )
 
 
+@router.get(
+    "/reviews/takedown-requests/{request_id}/evidence",
+    response_model=EvidenceListResponse,
+    summary="List Takedown Evidence",
+    description="Paginated evidence items for a takedown request",
+    responses={
+        200: {"description": "Success"},
+        403: {"description": "Permission denied", "model": ErrorResponse},
+        404: {"description": "Request not found", "model": ErrorResponse},
+        503: {"description": "Overloaded, retry after Retry-After seconds", "model": ErrorResponse},
+    },
+    dependencies=[admission("evidence")],
+)
+async def list_takedown_evidence(
+    request_id: UUID,
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    # db: Session = Depends(get_db),
+    # current_admin = Depends(get_current_admin_user),
+):
+    """
+    Page through a request's evidence instead of inlining the whole array.
+    
+    **Permissions Required:** reviews:moderate OR super_admin
+    
+    **Returns:**
+    - Evidence items with content/thumbnail URLs and processing metadata
+    - Pagination meta
+    """
+    
+    # TODO: Check permissions
+    # check_permission(current_admin, "reviews:moderate")
+    
+    # result = load_evidence_page(db, request_id, page, page_size)
+    # if result is None:
+    #     raise HTTPException(
+    #         status_code=status.HTTP_404_NOT_FOUND,
+    #         detail={
+    #             "code": "REQUEST_NOT_FOUND",
+    #             "message": "Takedown request not found",
+    #             "request_id": str(request_id)
+    #         }
+    #     )
+    # items, total_items = result
+    
+    # TODO: Replace with actual data
+    items: List[Evidence] = []
+    total_items = 0
+    
+    total_pages = math.ceil(total_items / page_size)
+    return EvidenceListResponse(
+        success=True,
+        data=items,
+        meta=PaginationMeta(
+            page=page,
+            page_size=page_size,
+            total_items=total_items,
+            total_pages=total_pages,
+            has_next=page < total_pages,
+            has_prev=page > 1,
+        ),
+    )
+
+
+@router.get(
+    "/reviews/takedown-requests/{request_id}/evidence/{evidence_id}/content",
+    summary="Download Takedown Evidence",
+    description="Evidence file with HTTP Range support",
+    responses={
+        200: {"description": "Whole file"},
+        206: {"description": "Requested byte range"},
+        404: {"description": "Evidence not found", "model": ErrorResponse},
+        416: {"description": "Range not satisfiable", "model": ErrorResponse},
+        503: {"description": "Overloaded, retry after Retry-After seconds", "model": ErrorResponse},
+    },
+)
+async def get_takedown_evidence_content(
+    request_id: UUID,
+    evidence_id: UUID,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    # db: Session = Depends(get_db),
+    # current_admin = Depends(get_current_admin_user),
+):
+    """
+    Stream an evidence file. A single "Range: bytes=start-end" header returns
+    206 with just that slice, so large documents can be read incrementally.
+    
+    **Permissions Required:** reviews:moderate OR super_admin
+    
+    Images and PDFs are served inline with their type; everything else is an
+    application/octet-stream attachment. Always sent with nosniff.
+    """
+    
+    # TODO: Check permissions
+    # check_permission(current_admin, "reviews:moderate")
+    
+    # Admitted for the lookup only, not while a slow client downloads the file
+    async with admit("evidence"):
+        # Only files recorded on this request are served, with the recorded type
+        # item = find_evidence_item(db, request_id, evidence_id)
+        # Return the pooled connection before streaming
+        # db.close()
+        
+        # TODO: Replace with the lookup above
+        item: Optional[Evidence] = None
+    
+    if item is None:
+        raise _evidence_not_found(request_id, evidence_id)
+    return stream_evidence_file(request_id, item, range_header)
+
+
+@router.get(
+    "/reviews/takedown-requests/{request_id}/evidence/{evidence_id}/thumbnail",
+    summary="Get Takedown Evidence Thumbnail",
+    description="Precomputed JPEG thumbnail for image evidence",
+    responses={
+        200: {"description": "Success"},
+        404: {"description": "Thumbnail not found or not generated yet", "model": ErrorResponse},
+        503: {"description": "Overloaded, retry after Retry-After seconds", "model": ErrorResponse},
+    },
+)
+async def get_takedown_evidence_thumbnail(
+    request_id: UUID,
+    evidence_id: UUID,
+    # db: Session = Depends(get_db),
+    # current_admin = Depends(get_current_admin_user),
+):
+    """
+    Serve the thumbnail written by the evidence pipeline.
+    
+    **Permissions Required:** reviews:moderate OR super_admin
+    """
+    
+    # TODO: Check permissions
+    # check_permission(current_admin, "reviews:moderate")
+    
+    # Admitted for the lookup only, not while the file is sent
+    async with admit("evidence"):
+        # item = find_evidence_item(db, request_id, evidence_id)
+        # db.close()
+        
+        # TODO: Replace with the lookup above
+        item: Optional[Evidence] = None
+    
+    thumbnail = evidence_dir(request_id, evidence_id) / "thumbnail.jpg"
+    if item is None or not thumbnail.is_file():
+        raise _evidence_not_found(request_id, evidence_id)
+    return FileResponse(
+        thumbnail,
+        media_type="image/jpeg",
+        headers={
+            "Cache-Control": "private, max-age=86400, immutable",
+            "X-Content-Type-Options": "nosniff",
+        },
+    )
+
+
 @router.post(
     "/reviews/takedown-requests/{request_id}/resolve",
     response_model=ResolveResponse,
@@ -438,7 +2138,9 @@ async def get_takedown_request(
         403: {"description": "Permission denied", "model": ErrorResponse},
         404: {"description": "Request not found", "model": ErrorResponse},
         409: {"description": "Already resolved or idempotency conflict", "model": ErrorResponse},
-    }
+        503: {"description": "Overloaded, retry after Retry-After seconds", "model": ErrorResponse},
+    },
+    dependencies=[admission("resolve")],
 )
 async def resolve_takedown_request(
     request_id: UUID,
@@ -452,6 +2154,7 @@ async def resolve_takedown_request(
     
     **Permissions Required:** reviews:moderate OR super_admin
     **Idempotency:** Required - provide Idempotency-Key header (UUID)
+    **Load Shedding:** 503 + Retry-After when the resolve queue is full (other takedown endpoints yield to it)
     
     **Path Parameters:**
     - request_id: UUID of the takedown request
@@ -494,9 +2197,7 @@ async def resolve_takedown_request(
     #         return cached_result
     
     # Get takedown request with row-level locking
-    # query = select(ReviewTakedownRequest).where(
-    #     ReviewTakedownRequest.id == request_id
-    # ).with_for_update()
+    # query = takedown_resolve_query(request_id)
     
     # request = db.execute(query).scalar_one_or_none()
     
@@ -570,6 +2271,11 @@ async def resolve_takedown_request(
     #     )
     #     db.add(audit_entry)
     #     
+    #     # Append the resolution time sketch delta (the status trigger updates the open queue)
+    #     record_takedown_resolution(
+    #         db, request.created_at, request.resolved_at, request.reason_code, request.vendor_id
+    #     )
+    #     
     #     # Commit transaction
     #     db.commit()
     #     
@@ -634,64 +2340,817 @@ async def resolve_takedown_request(
     )
 
 
-# ========================================
-# Helper Functions
-# ========================================
+@router.post(
+    "/reviews/takedown-requests:bulk",
+    response_model=BulkCreateResponse,
+    summary="Bulk Create Takedown Requests",
+    description="Create many vendor takedown requests in one set-based insert",
+    responses={
+        200: {"description": "Success"},
+        403: {"description": "Permission denied", "model": ErrorResponse},
+        404: {"description": "None of the submitted reviews exist", "model": ErrorResponse},
+        422: {"description": "Validation error", "model": ErrorResponse},
+        503: {"description": "Overloaded, retry after Retry-After seconds", "model": ErrorResponse},
+    },
+    dependencies=[admission("bulk_create")],
+)
+async def bulk_create_takedown_requests(
+    bulk_data: BulkCreateRequest,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    # db: Session = Depends(get_db),
+    # current_admin = Depends(get_current_admin_user),
+):
+    """
+    Create up to 500 takedown requests in one call (e.g. after review-bombing).
 
-def get_takedown_summary(db: Session) -> Dict[str, Any]:
-    """Get summary statistics for takedown requests (cached)"""
-    # TODO: Implement
-    # open_count = db.scalar(
-    #     select(func.count()).where(ReviewTakedownRequest.status == "open")
-    # )
-    # accepted_count = db.scalar(
-    #     select(func.count()).where(ReviewTakedownRequest.status == "accepted")
-    # )
-    # rejected_count = db.scalar(
-    #     select(func.count()).where(ReviewTakedownRequest.status == "rejected")
-    # )
-    # avg_resolution_time = db.scalar(
-    #     select(func.avg(
-    #         func.extract("epoch", ReviewTakedownRequest.resolved_at - ReviewTakedownRequest.created_at) / 3600
-    #     )).where(ReviewTakedownRequest.status.in_(["accepted", "rejected"]))
-    # )
-    
-    return {
-        "open": 0,
-        "accepted": 0,
-        "rejected": 0,
-        "avg_resolution_time_hours": 0.0
-    }
+    Admin-only ingest: moderators submit a vendor's batch on its behalf, so
+    any existing review may be included. A vendor-facing version of this
+    endpoint must also restrict the INSERT ... SELECT to the caller's reviews
+    (AND r.vendor_id = :caller_vendor_id) and report the rest as skipped.
 
+    **Permissions Required:** reviews:moderate OR super_admin
+    **Idempotency:** Recommended - provide Idempotency-Key header (UUID)
 
-def generate_internal_analysis(request, db: Session) -> InternalAnalysis:
-    """Generate internal analysis for admin decision making"""
-    # TODO: Implement
-    # - Check for similar reviews by same user
-    # - Check for similar complaints against vendor
-    # - Analyze user behavior flags
-    # - Check review timing (suspicious if posted long after booking)
-    # - Run sentiment analysis
-    
-    return InternalAnalysis(
-        similar_reviews_by_user=[],
-        similar_complaints_against_vendor=0,
-        user_behavior_flags=[],
-        review_timing_suspicious=False,
-        sentiment_analysis=None
-    )
+    **Request Body:**
+    - items: List of takedown submissions (1-500), each validated with the Evidence schema
 
+    **Deduplication:**
+    - Repeated review_id within the batch: first item wins
+    - review_id that already has an open request: skipped
+    - review_id that does not exist: skipped
 
-def generate_timeline(request, db: Session) -> List[TimelineEvent]:
-    """Generate timeline of events for takedown request"""
-    # TODO: Implement
-    # - Booking created
-    # - Booking completed
-    # - Review posted
-    # - Takedown requested
-    # - Takedown resolved (if applicable)
-    
-    return []
+    The vendor of each request is read from its review, not sent by the client.
+
+    **Process:**
+    1. Dedupe within the batch
+    2. Dedupe against open requests with one IN query
+    3. INSERT ... SELECT ... JOIN reviews ON CONFLICT DO NOTHING in chunks of BULK_INSERT_CHUNK_SIZE
+    4. Statement-level trigger updates reviews once per statement
+
+    **Returns:**
+    - created: id, request_number and review_id of each inserted request
+    - skipped: review_id and reason for each deduplicated item
+    """
+
+    # TODO: Check permissions
+    # check_permission(current_admin, "reviews:moderate")
+
+    # Check idempotency
+    # if idempotency_key:
+    #     cached_result = check_idempotency_key(idempotency_key, "bulk_create_takedown", None)
+    #     if cached_result:
+    #         return cached_result
+
+    unique_items, skipped = dedupe_takedown_batch(bulk_data.items)
+
+    # Dedupe against open requests in one round-trip
+    # open_review_ids = set(db.scalars(
+    #     select(ReviewTakedownRequest.review_id).where(
+    #         ReviewTakedownRequest.review_id.in_([item.review_id for item in unique_items]),
+    #         ReviewTakedownRequest.status == "open",
+    #     )
+    # ))
+    # skipped.extend(
+    #     {"review_id": str(item.review_id), "reason": "open_request_exists"}
+    #     for item in unique_items if item.review_id in open_review_ids
+    # )
+    # unique_items = [item for item in unique_items if item.review_id not in open_review_ids]
+
+    # One INSERT ... SELECT per chunk; vendor_id is read from reviews and
+    # request_number comes from the column default. The statement-level trigger
+    # updates reviews once per chunk. ON CONFLICT covers a concurrent submission
+    # racing past the check above (uq_takedown_open_review).
+    # For batches far beyond max_length, COPY into a temp table and
+    # INSERT ... SELECT ... ON CONFLICT DO NOTHING from it instead.
+    # rows = build_takedown_rows(unique_items)
+    # created = []
+    # try:
+    #     for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+    #         created.extend(insert_takedown_rows(db, rows[start:start + BULK_INSERT_CHUNK_SIZE]))
+    #     db.commit()
+    # except Exception as e:
+    #     db.rollback()
+    #     raise HTTPException(
+    #         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    #         detail={
+    #             "code": "BULK_CREATE_FAILED",
+    #             "message": "Failed to create takedown requests",
+    #             "error": str(e)
+    #         }
+    #     )
+    #
+    # Rows not inserted either lost the ON CONFLICT race or had no matching review
+    # created_review_ids = {row.review_id for row in created}
+    # existing_review_ids = set(db.scalars(
+    #     select(Review.id).where(
+    #         Review.id.in_([item.review_id for item in unique_items if item.review_id not in created_review_ids])
+    #     )
+    # ))
+    # skipped.extend(
+    #     {
+    #         "review_id": str(item.review_id),
+    #         "reason": "open_request_exists" if item.review_id in existing_review_ids else "review_not_found",
+    #     }
+    #     for item in unique_items if item.review_id not in created_review_ids
+    # )
+    # if not created and not existing_review_ids and not open_review_ids:
+    #     raise HTTPException(
+    #         status_code=status.HTTP_404_NOT_FOUND,
+    #         detail={
+    #             "code": "REVIEWS_NOT_FOUND",
+    #             "message": "None of the submitted reviews exist",
+    #             "review_ids": [str(item.review_id) for item in unique_items],
+    #         }
+    #     )
+    
+    # response = BulkCreateResponse(
+    #     success=True,
+    #     data={
+    #         "created": [
+    #             {"id": str(row.id), "request_number": row.request_number, "review_id": str(row.review_id)}
+    #             for row in created
+    #         ],
+    #         "skipped": skipped,
+    #         "counts": {
+    #             "submitted": len(bulk_data.items),
+    #             "created": len(created),
+    #             "skipped": len(skipped),
+    #         },
+    #     },
+    # )
+    
+    # Store idempotency result
+    # if idempotency_key:
+    #     store_idempotency_result(idempotency_key, response, ttl=86400)
+    
+    # return response
+
+    # TODO: Replace with actual implementation
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "code": "REVIEWS_NOT_FOUND",
+            "message": "None of the submitted reviews exist",
+            "review_ids": [str(item.review_id) for item in unique_items],
+        }
+    )
+
+
+@router.get(
+    "/reviews/takedown-analytics/resolution-time",
+    response_model=ResolutionAnalyticsResponse,
+    summary="Takedown Resolution Time Analytics",
+    description="Resolution time percentiles and open queue age from precomputed sketches",
+    responses={
+        200: {"description": "Success"},
+        403: {"description": "Permission denied", "model": ErrorResponse},
+    }
+)
+async def get_resolution_analytics(
+    from_date: Optional[date] = Query(None, description="First day (inclusive)"),
+    to_date: Optional[date] = Query(None, description="Last day (inclusive)"),
+    reason_code: Optional[str] = Query(None, description="Filter by reason code"),
+    vendor_id: Optional[str] = Query(None, description="Filter by vendor ID"),
+    # db: Session = Depends(get_db),
+    # current_admin = Depends(get_current_admin_user),
+):
+    """
+    Resolution time and open queue age percentiles over an arbitrary range.
+
+    **Permissions Required:** reviews:moderate OR super_admin
+
+    **Query Parameters:**
+    - from_date/to_date: Day range; resolution day for resolution time,
+      creation day for open queue age
+    - reason_code: Filter by reason code
+    - vendor_id: Filter by vendor UUID
+
+    **Returns:**
+    - resolution_time: count, p50/p90/p99 and mean hours (~1% relative error)
+    - open_queue_age: same for currently open requests, from per-hour counts
+      (within open_queue_age_error_hours plus the relative error)
+
+    Reads only the per-day sketch tables, never review_takedown_requests.
+    """
+
+    # TODO: Check permissions
+    # check_permission(current_admin, "reviews:moderate")
+
+    # resolution = load_resolution_sketch(db, from_date, to_date, reason_code, vendor_id)
+    # open_queue = load_open_queue_age_sketch(db, from_date, to_date, reason_code, vendor_id)
+
+    # TODO: Replace with sketches loaded from the database
+    resolution = ResolutionTimeSketch()
+    open_queue = ResolutionTimeSketch()
+
+    return ResolutionAnalyticsResponse(
+        success=True,
+        data=ResolutionAnalytics(
+            from_date=from_date,
+            to_date=to_date,
+            reason_code=reason_code,
+            vendor_id=vendor_id,
+            resolution_time=resolution.to_percentiles(),
+            open_queue_age=open_queue.to_percentiles(),
+            relative_accuracy=ResolutionTimeSketch.RELATIVE_ACCURACY,
+            open_queue_age_error_hours=OPEN_QUEUE_AGE_ERROR_HOURS,
+        ),
+    )
+
+
+@router.get(
+    "/reviews/takedown-admission/metrics",
+    response_model=AdmissionMetricsResponse,
+    summary="Takedown Admission Metrics",
+    description="Queued, in-flight and shed request counters per takedown endpoint",
+)
+async def get_admission_metrics(
+    # current_admin = Depends(get_current_admin_user),
+):
+    """
+    Admission control metrics for this worker process.
+
+    **Permissions Required:** reviews:moderate OR super_admin
+
+    **Returns:**
+    - Per endpoint (resolve, list, detail, batch_detail, evidence, bulk_create):
+      in_flight, queued, peak_queued, max_concurrent, borrowed (connections in use
+      above its share), admitted_total, shed_total and shed_by_reason
+      (queue_full, queue_timeout)
+    """
+    return AdmissionMetricsResponse(
+        success=True,
+        data={name: limiter.snapshot() for name, limiter in _ADMISSION_LIMITERS.items()},
+    )
+
+
+@router.get(
+    "/reviews/takedown-router/ready",
+    response_model=ReadinessResponse,
+    summary="Takedown Router Readiness",
+    description="200 once this worker has finished warm-up, 503 until then",
+    responses={503: {"description": "Warm-up not finished or failed", "model": ErrorResponse}},
+)
+async def get_takedown_router_readiness():
+    """
+    Readiness probe for autoscaled workers; point the load balancer health
+    check here so traffic only reaches warmed workers.
+
+    **Returns:**
+    - ready, per-step warm-up timings (models, openapi, request, pool) in ms, and the
+      warm-up error if one occurred
+    - pool: pre-fill status (skipped, pending, ready, retrying), attempts and last
+      error; a worker can be ready while the pool is still retrying
+    """
+    if not _warmup_state["ready"]:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "code": "WORKER_WARMING_UP",
+                "message": "Takedown router warm-up has not finished",
+                "error": _warmup_state["error"],
+            },
+            headers={"Retry-After": "1"},
+        )
+    return ReadinessResponse(success=True, data=dict(_warmup_state))
+
+
+# ========================================
+# Helper Functions
+# ========================================
+
+# Evidence downloads and thumbnails: Range offsets refer to the stored bytes and
+# the files are already compressed media, so response compression skips them
+UNCOMPRESSED_PATHS = re.compile(r"/reviews/takedown-requests/[^/]+/evidence/[^/]+/(content|thumbnail)$")
+
+# Evidence uploads (POST); their bodies are size-checked before parsing
+EVIDENCE_UPLOAD_PATH = re.compile(r"/reviews/takedown-requests/[^/]+/evidence$")
+
+
+def get_takedown_summary(db: Session) -> Dict[str, Any]:
+    """Get summary statistics for takedown requests (cached)"""
+    # TODO: Implement
+    # open_count = db.scalar(
+    #     select(func.count()).where(ReviewTakedownRequest.status == "open")
+    # )
+    # accepted_count = db.scalar(
+    #     select(func.count()).where(ReviewTakedownRequest.status == "accepted")
+    # )
+    # rejected_count = db.scalar(
+    #     select(func.count()).where(ReviewTakedownRequest.status == "rejected")
+    # )
+    # Mean from the resolution sketch instead of scanning resolved rows
+    # avg_resolution_time = load_resolution_sketch(db).to_percentiles().mean_hours
+    
+    return {
+        "open": 0,
+        "accepted": 0,
+        "rejected": 0,
+        "avg_resolution_time_hours": 0.0
+    }
+
+
+class PathExcludedCompression:
+    """ASGI wrapper applying a compression middleware to every path except the excluded ones"""
+
+    def __init__(self, app, compression_class, exclude: "re.Pattern[str]", **options):
+        self.app = app
+        self.compressed = compression_class(app, **options)
+        self.exclude = exclude
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and self.exclude.search(scope["path"]):
+            await self.app(scope, receive, send)
+        else:
+            await self.compressed(scope, receive, send)
+
+
+def install_response_compression(
+    app: FastAPI,
+    minimum_size: int = 1024,
+    exclude: "re.Pattern[str]" = UNCOMPRESSED_PATHS,
+) -> str:
+    """
+    Negotiated response compression for the whole app (call once from main.py).
+
+    Uses brotli-asgi when installed (br, falling back to gzip per
+    Accept-Encoding), otherwise Starlette's GZipMiddleware. Both compress
+    streaming responses chunk by chunk. Paths matching `exclude` are passed
+    through untouched. Returns the preferred encoding.
+    """
+    try:
+        from brotli_asgi import BrotliMiddleware
+    except ImportError:
+        from fastapi.middleware.gzip import GZipMiddleware
+        app.add_middleware(
+            PathExcludedCompression, compression_class=GZipMiddleware, exclude=exclude,
+            minimum_size=minimum_size, compresslevel=6,
+        )
+        return "gzip"
+    app.add_middleware(
+        PathExcludedCompression, compression_class=BrotliMiddleware, exclude=exclude,
+        minimum_size=minimum_size, quality=4, gzip_fallback=True,
+    )
+    return "br"
+
+
+class UploadBodyLimit:
+    """
+    ASGI wrapper answering 413 for POST bodies over max_bytes on matching
+    paths before the app reads them. A declared Content-Length is checked up
+    front; chunked bodies are counted as they arrive and the app's response
+    is replaced once the limit is crossed.
+    """
+
+    def __init__(self, app, path: "re.Pattern[str]", max_bytes: int):
+        self.app = app
+        self.path = path
+        self.max_bytes = max_bytes
+
+    async def reject(self, scope, receive, send):
+        error = _evidence_too_large()
+        await JSONResponse({"detail": error.detail}, status_code=error.status_code)(scope, receive, send)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not self.path.search(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            await self.reject(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Stops the app's body parsing; its error response is dropped below
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def limited_send(message):
+            if received <= self.max_bytes:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, limited_send)
+        except Exception:
+            if received <= self.max_bytes:
+                raise
+        if received > self.max_bytes:
+            await self.reject(scope, receive, send)
+
+
+def install_evidence_upload_limit(app: FastAPI, max_bytes: int = EVIDENCE_MAX_BODY_BYTES):
+    """
+    Reject evidence uploads over max_bytes with 413 before Starlette spools
+    the multipart body (call once from main.py). Keep the reverse proxy's own
+    body limit (e.g. nginx client_max_body_size) at or above this.
+    """
+    app.add_middleware(UploadBodyLimit, path=EVIDENCE_UPLOAD_PATH, max_bytes=max_bytes)
+
+
+def dedupe_takedown_batch(items: List[TakedownCreateItem]):
+    """Drop repeated review_ids within a batch, keeping the first submission"""
+    seen = set()
+    unique_items = []
+    skipped = []
+    for item in items:
+        if item.review_id in seen:
+            skipped.append({"review_id": str(item.review_id), "reason": "duplicate_in_batch"})
+            continue
+        seen.add(item.review_id)
+        unique_items.append(item)
+    return unique_items, skipped
+
+
+def build_takedown_rows(items: List[TakedownCreateItem]) -> List[Dict[str, Any]]:
+    """
+    Client-supplied column values for insert_takedown_rows; vendor_id is
+    joined from reviews and request_number is a column default.
+    """
+    return [
+        {
+            "review_id": item.review_id,
+            "reason_code": item.reason_code,
+            "reason_description": item.reason_description,
+            "evidence": jsonable_encoder(item.evidence, exclude_none=True),
+            "evidence_summary": jsonable_encoder(summarize_evidence(item.evidence)),
+            "vendor_notes": item.vendor_notes,
+            "priority": item.priority,
+        }
+        for item in items
+    ]
+
+
+def insert_takedown_rows(db: Session, rows: List[Dict[str, Any]]):
+    """
+    Insert one chunk of build_takedown_rows output as a single statement.
+
+    vendor_id is read from the review rather than the submission; rows whose
+    review does not exist are not inserted.
+    Returns (id, request_number, review_id) for each inserted row.
+    """
+    return db.execute(
+        text("""
+            INSERT INTO review_takedown_requests (
+                review_id, vendor_id, status, reason_code, reason_description,
+                evidence, evidence_summary, vendor_notes, priority
+            )
+            SELECT r.id, r.vendor_id, 'open', i.reason_code, i.reason_description,
+                   i.evidence, i.evidence_summary, i.vendor_notes, i.priority
+            FROM jsonb_to_recordset(CAST(:rows AS JSONB)) AS i(
+                review_id UUID, reason_code VARCHAR, reason_description TEXT,
+                evidence JSONB, evidence_summary JSONB, vendor_notes TEXT, priority VARCHAR
+            )
+            JOIN reviews r ON r.id = i.review_id
+            ON CONFLICT (review_id) WHERE status = 'open' DO NOTHING
+            RETURNING id, request_number, review_id
+        """),
+        {"rows": json.dumps(jsonable_encoder(rows))},
+    ).all()
+
+
+def parse_batch_ids(raw_ids: List[str]) -> List[UUID]:
+    """
+    Parse repeated/comma-separated ids, dropping duplicates but keeping order.
+    Stops with 400 as soon as there are more than BATCH_DETAIL_MAX_IDS unique ids.
+    """
+    def invalid_batch_size():
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "code": "INVALID_BATCH_SIZE",
+                "message": f"Provide between 1 and {BATCH_DETAIL_MAX_IDS} request ids",
+                "max_ids": BATCH_DETAIL_MAX_IDS
+            }
+        )
+
+    request_ids: Dict[UUID, None] = {}
+    for match in (match for raw in raw_ids for match in re.finditer(r"[^,]+", raw)):
+        value = match.group().strip()
+        if not value:
+            continue
+        try:
+            request_id = UUID(value)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": "INVALID_REQUEST_ID",
+                    "message": "Request ids must be UUIDs",
+                    "request_id": value
+                }
+            )
+        request_ids[request_id] = None
+        if len(request_ids) > BATCH_DETAIL_MAX_IDS:
+            raise invalid_batch_size()
+
+    if not request_ids:
+        raise invalid_batch_size()
+    return list(request_ids)
+
+
+def takedown_list_query(
+    status: Optional[str] = "open",
+    reason_code: Optional[str] = None,
+    vendor_id: Optional[str] = None,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+    evidence_mode: str = "full",
+):
+    """Unpaginated SELECT for the list endpoint; warm-up compiles the same statement"""
+    # TODO: Implement
+    # query = select(ReviewTakedownRequest).options(
+    #     joinedload(ReviewTakedownRequest.review).joinedload(Review.reviewer),
+    #     joinedload(ReviewTakedownRequest.vendor),
+    #     joinedload(ReviewTakedownRequest.resolved_by)
+    # )
+    # if evidence_mode == "summary":
+    #     # Skip the evidence JSONB entirely; evidence_summary is a small column
+    #     query = query.options(defer(ReviewTakedownRequest.evidence))
+    
+    # Apply filters
+    # filters = []
+    # if status:
+    #     filters.append(ReviewTakedownRequest.status == status)
+    # if reason_code:
+    #     filters.append(ReviewTakedownRequest.reason_code == reason_code)
+    # if vendor_id:
+    #     filters.append(ReviewTakedownRequest.vendor_id == vendor_id)
+    # if from_date:
+    #     filters.append(ReviewTakedownRequest.created_at >= from_date)
+    # if to_date:
+    #     filters.append(ReviewTakedownRequest.created_at <= to_date)
+    
+    # if filters:
+    #     query = query.where(and_(*filters))
+    
+    # Apply sorting
+    # if sort_by == "priority":
+    #     # Sort: high -> medium -> low, then by created_at
+    #     priority_order = case(
+    #         (ReviewTakedownRequest.priority == "high", 1),
+    #         (ReviewTakedownRequest.priority == "medium", 2),
+    #         (ReviewTakedownRequest.priority == "low", 3),
+    #     )
+    #     if sort_order == "desc":
+    #         query = query.order_by(priority_order.desc(), ReviewTakedownRequest.created_at.desc())
+    #     else:
+    #         query = query.order_by(priority_order, ReviewTakedownRequest.created_at)
+    # else:
+    #     if sort_order == "desc":
+    #         query = query.order_by(ReviewTakedownRequest.created_at.desc())
+    #     else:
+    #         query = query.order_by(ReviewTakedownRequest.created_at)
+    
+    # return query
+
+
+def takedown_details_query(request_ids: List[UUID]):
+    """SELECT for load_takedown_details; warm-up compiles the same statement"""
+    # TODO: Implement
+    # One id (detail endpoint): a single joined query. Many ids: selectinload
+    # issues one IN query per relationship regardless of batch size.
+    # loader = joinedload if len(request_ids) == 1 else selectinload
+    # return select(ReviewTakedownRequest).options(
+    #     loader(ReviewTakedownRequest.review).options(loader(Review.reviewer), loader(Review.booking)),
+    #     loader(ReviewTakedownRequest.vendor),
+    #     loader(ReviewTakedownRequest.resolved_by)
+    # ).where(ReviewTakedownRequest.id.in_(request_ids))
+
+
+def takedown_resolve_query(request_id: UUID):
+    """Row-locking SELECT for the resolve endpoint; warm-up compiles the same statement"""
+    # TODO: Implement
+    # return select(ReviewTakedownRequest).where(
+    #     ReviewTakedownRequest.id == request_id
+    # ).with_for_update()
+
+
+def load_takedown_details(db: Session, request_ids: List[UUID]) -> Dict[UUID, TakedownRequestDetail]:
+    """Build TakedownRequestDetail for each found id with set-based queries"""
+    # TODO: Implement
+    # query = takedown_details_query(request_ids)
+    # requests = db.execute(query).unique().scalars().all()
+    # analyses = generate_internal_analyses(requests, db)
+    # timelines = generate_timelines(requests, db)
+    
+    # return {
+    #     request.id: takedown_detail(request, analyses[request.id], timelines[request.id])
+    #     for request in requests
+    # }
+    
+    return {}
+
+
+def reviewer_info(user) -> ReviewerInfo:
+    """ReviewerInfo from a loaded User row"""
+    return ReviewerInfo(
+        id=str(user.id),
+        name=user.name,
+        email=user.email,
+        phone=user.phone,
+        profile_image=user.profile_image,
+        account_created_at=user.created_at,
+        total_reviews=user.total_reviews or 0,
+        total_bookings=user.total_bookings or 0,
+    )
+
+
+def vendor_info(vendor) -> VendorInfo:
+    """VendorInfo from a loaded Vendor row"""
+    return VendorInfo(
+        id=str(vendor.id),
+        name=vendor.name,
+        display_name=vendor.display_name,
+        email=vendor.email,
+        phone=vendor.phone,
+        logo=vendor.logo,
+        rating=vendor.rating,
+        total_reviews=vendor.total_reviews or 0,
+        total_takedown_requests=vendor.total_takedown_requests or 0,
+        accepted_takedowns=vendor.accepted_takedowns or 0,
+        rejected_takedowns=vendor.rejected_takedowns or 0,
+    )
+
+
+def takedown_fields(request, evidence_mode: str = "full") -> Dict[str, Any]:
+    """
+    TakedownRequestBase fields read from the takedown row itself, mapped
+    explicitly: ids are UUIDs on the row and the resolution is stored as flat
+    columns. evidence_mode "summary" leaves the evidence array out.
+    """
+    admin = request.resolved_by
+    return {
+        "id": str(request.id),
+        "request_number": request.request_number,
+        "status": request.status,
+        "reason_code": request.reason_code,
+        "reason_description": request.reason_description,
+        "evidence": (request.evidence or []) if evidence_mode == "full" else [],
+        "evidence_summary": request.evidence_summary or EvidenceSummary(),
+        "vendor_notes": request.vendor_notes,
+        "priority": request.priority,
+        "created_at": request.created_at,
+        "resolved_at": request.resolved_at,
+        "resolved_by": (
+            AdminUserInfo(id=str(admin.id), name=admin.name, email=admin.email) if admin else None
+        ),
+        "resolution": (
+            Resolution(
+                decision=request.decision,
+                action_taken=request.action_taken,
+                reason=request.resolution_reason,
+                admin_notes=request.admin_notes,
+                review_status_after=request.review.status,
+            )
+            if request.decision else None
+        ),
+        "admin_notes": request.admin_notes,
+    }
+
+
+def review_fields(review) -> Dict[str, Any]:
+    """ReviewBase fields"""
+    return {
+        "id": str(review.id),
+        "rating": review.rating,
+        "title": review.title,
+        "body": review.body,
+        "status": review.status,
+        "created_at": review.created_at,
+        "updated_at": review.updated_at,
+    }
+
+
+def takedown_list_item(request, evidence_mode: str = "full") -> TakedownRequestList:
+    """TakedownRequestList from a takedown row with review, reviewer, vendor and resolver loaded"""
+    return TakedownRequestList(
+        **takedown_fields(request, evidence_mode),
+        review=ReviewInfo(**review_fields(request.review), reviewer=reviewer_info(request.review.reviewer)),
+        vendor=vendor_info(request.vendor),
+    )
+
+
+def build_takedown_list(requests, meta: PaginationMeta, evidence_mode: str = "full") -> TakedownListResponse:
+    """Nested list page from loaded takedown rows"""
+    return TakedownListResponse(
+        success=True,
+        data=[takedown_list_item(request, evidence_mode) for request in requests],
+        meta=meta,
+    )
+
+
+def build_takedown_list_normalized(
+    requests, meta: PaginationMeta, evidence_mode: str = "full"
+) -> TakedownListNormalizedResponse:
+    """
+    Normalized list page from loaded takedown rows: each vendor and reviewer
+    is converted once into the side tables and rows only carry their ids.
+    """
+    vendors: Dict[str, VendorInfo] = {}
+    reviewers: Dict[str, ReviewerInfo] = {}
+    data = []
+    for request in requests:
+        vendor_id = str(request.vendor.id)
+        reviewer_id = str(request.review.reviewer.id)
+        if vendor_id not in vendors:
+            vendors[vendor_id] = vendor_info(request.vendor)
+        if reviewer_id not in reviewers:
+            reviewers[reviewer_id] = reviewer_info(request.review.reviewer)
+        data.append(TakedownRequestCompact(
+            **takedown_fields(request, evidence_mode),
+            review=ReviewCompact(**review_fields(request.review), reviewer_id=reviewer_id),
+            vendor_id=vendor_id,
+        ))
+    return TakedownListNormalizedResponse(
+        success=True,
+        data=data,
+        vendors=vendors,
+        reviewers=reviewers,
+        meta=meta,
+    )
+
+
+def takedown_detail(request, analysis: InternalAnalysis, timeline: List[TimelineEvent]) -> TakedownRequestDetail:
+    """TakedownRequestDetail from a row loaded by load_takedown_details"""
+    booking = request.review.booking
+    return TakedownRequestDetail(
+        # dict(model) is shallow, so the nested models are reused as-is
+        **dict(takedown_list_item(request)),
+        booking=(
+            BookingInfo(
+                id=str(booking.id),
+                booking_number=booking.booking_number,
+                status=booking.status,
+                scheduled_at=booking.scheduled_at,
+                completed_at=booking.completed_at,
+                amount_cents=booking.amount_cents,
+                payment_status=booking.payment_status,
+                has_dispute=booking.has_dispute,
+            )
+            if booking else None
+        ),
+        internal_analysis=analysis,
+        timeline=timeline,
+    )
+
+
+def generate_internal_analyses(requests, db: Session) -> Dict[Any, InternalAnalysis]:
+    """Generate internal analysis for many requests with one query per signal"""
+    # TODO: Implement
+    # - Similar reviews by same user: one query over all reviewer ids
+    #   select(Review.reviewer_id, Review.id).where(
+    #       Review.reviewer_id.in_(reviewer_ids), Review.id.not_in(review_ids)
+    #   )
+    # - Similar complaints against vendor: one grouped count over all vendor ids
+    #   select(ReviewTakedownRequest.vendor_id, func.count())
+    #       .where(ReviewTakedownRequest.vendor_id.in_(vendor_ids))
+    #       .group_by(ReviewTakedownRequest.vendor_id)
+    # - Analyze user behavior flags
+    # - Check review timing (suspicious if posted long after booking)
+    # - Run sentiment analysis
+    
+    return {
+        request.id: InternalAnalysis(
+            similar_reviews_by_user=[],
+            similar_complaints_against_vendor=0,
+            user_behavior_flags=[],
+            review_timing_suspicious=False,
+            sentiment_analysis=None
+        )
+        for request in requests
+    }
+
+
+def generate_internal_analysis(request, db: Session) -> InternalAnalysis:
+    """Generate internal analysis for admin decision making"""
+    return generate_internal_analyses([request], db)[request.id]
+
+
+def generate_timelines(requests, db: Session) -> Dict[Any, List[TimelineEvent]]:
+    """Generate timelines for many requests from already-loaded rows"""
+    # TODO: Implement
+    # Built from columns loaded by load_takedown_details, no extra queries:
+    # - Booking created
+    # - Booking completed
+    # - Review posted
+    # - Takedown requested
+    # - Takedown resolved (if applicable)
+    
+    return {request.id: [] for request in requests}
+
+
+def generate_timeline(request, db: Session) -> List[TimelineEvent]:
+    """Generate timeline of events for takedown request"""
+    return generate_timelines([request], db)[request.id]
 
 
 async def queue_notifications(request, resolve_data: ResolveRequest, admin) -> Dict[str, Any]:
@@ -810,4 +3269,556 @@ CREATE TRIGGER trg_update_review_takedown_flag
   AFTER INSERT ON review_takedown_requests
   FOR EACH ROW
   EXECUTE FUNCTION update_review_takedown_flag();
+
+
+-- Migration: Set-based inserts for bulk takedown creation
+-- Run after the migration above; safe to re-run
+
+-- Request numbers come from a column default instead of a per-row trigger,
+-- so multi-row INSERT and COPY need no plpgsql call per row
+ALTER TABLE review_takedown_requests
+  ALTER COLUMN request_number SET DEFAULT
+    'TR-' || TO_CHAR(CURRENT_DATE, 'YYYY') || '-' ||
+    LPAD(NEXTVAL('takedown_request_seq')::TEXT, 6, '0');
+
+DROP TRIGGER IF EXISTS trg_generate_takedown_request_number ON review_takedown_requests;
+DROP FUNCTION IF EXISTS generate_takedown_request_number();
+
+-- At most one open request per review; backs ON CONFLICT DO NOTHING in bulk create.
+-- Resolve duplicate open requests first if this fails on existing data.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_takedown_open_review
+  ON review_takedown_requests(review_id)
+  WHERE status = 'open';
+
+-- One reviews UPDATE per INSERT statement instead of one per row
+CREATE OR REPLACE FUNCTION update_review_takedown_flags_batch()
+RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE reviews r
+  SET has_takedown_request = TRUE,
+      takedown_request_count = r.takedown_request_count + n.request_count
+  FROM (
+    SELECT review_id, COUNT(*) AS request_count
+    FROM new_takedown_requests
+    GROUP BY review_id
+  ) n
+  WHERE r.id = n.review_id;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_update_review_takedown_flag ON review_takedown_requests;
+DROP TRIGGER IF EXISTS trg_update_review_takedown_flags ON review_takedown_requests;
+DROP FUNCTION IF EXISTS update_review_takedown_flag();
+
+CREATE TRIGGER trg_update_review_takedown_flags
+  AFTER INSERT ON review_takedown_requests
+  REFERENCING NEW TABLE AS new_takedown_requests
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION update_review_takedown_flags_batch();
+
+
+-- Migration: Resolution time sketches for takedown analytics
+-- Bucket numbers are ResolutionTimeSketch.bucket_index() values; seed with
+-- backfill_resolution_histogram(db) after running this
+
+CREATE TABLE IF NOT EXISTS takedown_resolution_histogram (
+  day DATE NOT NULL,
+  reason_code VARCHAR(50) NOT NULL,
+  vendor_id UUID NOT NULL,
+  bucket INT NOT NULL,
+  count BIGINT NOT NULL DEFAULT 0,
+  PRIMARY KEY (day, reason_code, vendor_id, bucket)
+);
+
+CREATE INDEX IF NOT EXISTS idx_resolution_histogram_vendor_day
+  ON takedown_resolution_histogram(vendor_id, day);
+
+CREATE TABLE IF NOT EXISTS takedown_open_queue (
+  created_day DATE NOT NULL,
+  reason_code VARCHAR(50) NOT NULL,
+  vendor_id UUID NOT NULL,
+  open_count INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (created_day, reason_code, vendor_id)
+);
+
+-- Open counts per creation day, maintained once per INSERT statement
+CREATE OR REPLACE FUNCTION track_open_takedowns_batch()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO takedown_open_queue (created_day, reason_code, vendor_id, open_count)
+  SELECT created_at::DATE, reason_code, vendor_id, COUNT(*)
+  FROM new_takedown_requests
+  WHERE status = 'open'
+  GROUP BY created_at::DATE, reason_code, vendor_id
+  ON CONFLICT (created_day, reason_code, vendor_id)
+  DO UPDATE SET open_count = takedown_open_queue.open_count + EXCLUDED.open_count;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_track_open_takedowns ON review_takedown_requests;
+
+CREATE TRIGGER trg_track_open_takedowns
+  AFTER INSERT ON review_takedown_requests
+  REFERENCING NEW TABLE AS new_takedown_requests
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION track_open_takedowns_batch();
+
+-- Seed open counts from existing rows
+INSERT INTO takedown_open_queue (created_day, reason_code, vendor_id, open_count)
+SELECT created_at::DATE, reason_code, vendor_id, COUNT(*)
+FROM review_takedown_requests
+WHERE status = 'open'
+GROUP BY created_at::DATE, reason_code, vendor_id
+ON CONFLICT (created_day, reason_code, vendor_id)
+DO UPDATE SET open_count = EXCLUDED.open_count;
+
+
+-- Migration: Evidence summaries for list views
+-- Fill existing rows with backfill_evidence_summaries(db) after running this
+
+ALTER TABLE review_takedown_requests
+  ADD COLUMN IF NOT EXISTS evidence_summary JSONB;
+
+
+-- Migration: Append-only sketch deltas
+-- Resolves and inserts append to the delta tables instead of updating the
+-- shared per-(day, reason_code, vendor_id) rows under a row lock;
+-- compact_takedown_sketches() folds them in. Readers sum both tables.
+
+CREATE TABLE IF NOT EXISTS takedown_resolution_histogram_delta (
+  id BIGSERIAL PRIMARY KEY,
+  day DATE NOT NULL,
+  reason_code VARCHAR(50) NOT NULL,
+  vendor_id UUID NOT NULL,
+  bucket INT NOT NULL,
+  count BIGINT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS takedown_open_queue_delta (
+  id BIGSERIAL PRIMARY KEY,
+  created_day DATE NOT NULL,
+  reason_code VARCHAR(50) NOT NULL,
+  vendor_id UUID NOT NULL,
+  open_count INT NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION track_open_takedowns_batch()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO takedown_open_queue_delta (created_day, reason_code, vendor_id, open_count)
+  SELECT created_at::DATE, reason_code, vendor_id, COUNT(*)
+  FROM new_takedown_requests
+  WHERE status = 'open'
+  GROUP BY created_at::DATE, reason_code, vendor_id;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Only deltas committed before the DELETE are moved; later ones wait for the next run
+CREATE OR REPLACE FUNCTION compact_takedown_sketches()
+RETURNS VOID AS $$
+BEGIN
+  IF NOT pg_try_advisory_xact_lock(hashtext('compact_takedown_sketches')) THEN
+    RETURN;
+  END IF;
+
+  WITH moved AS (
+    DELETE FROM takedown_resolution_histogram_delta
+    RETURNING day, reason_code, vendor_id, bucket, count
+  )
+  INSERT INTO takedown_resolution_histogram (day, reason_code, vendor_id, bucket, count)
+  SELECT day, reason_code, vendor_id, bucket, SUM(count)
+  FROM moved
+  GROUP BY day, reason_code, vendor_id, bucket
+  ON CONFLICT (day, reason_code, vendor_id, bucket)
+  DO UPDATE SET count = takedown_resolution_histogram.count + EXCLUDED.count;
+
+  WITH moved AS (
+    DELETE FROM takedown_open_queue_delta
+    RETURNING created_day, reason_code, vendor_id, open_count
+  )
+  INSERT INTO takedown_open_queue (created_day, reason_code, vendor_id, open_count)
+  SELECT created_day, reason_code, vendor_id, SUM(open_count)
+  FROM moved
+  GROUP BY created_day, reason_code, vendor_id
+  ON CONFLICT (created_day, reason_code, vendor_id)
+  DO UPDATE SET open_count = takedown_open_queue.open_count + EXCLUDED.open_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- With pg_cron installed, instead of calling compact_takedown_sketches(db) from the scheduler:
+-- SELECT cron.schedule('compact-takedown-sketches', '* * * * *', 'SELECT compact_takedown_sketches()');
+
+
+-- Migration: Hourly open queue kept in sync on status change and delete
+-- Open counts move from creation day to creation hour, and statement-level
+-- triggers now track every way a row stops (or starts) being open: status
+-- updates from any path and deletes, including ON DELETE CASCADE from
+-- reviews and vendors. record_takedown_resolution no longer decrements.
+-- Run in one transaction; the tables are rebuilt and reseeded.
+
+DROP TABLE IF EXISTS takedown_open_queue_delta;
+DROP TABLE IF EXISTS takedown_open_queue;
+
+CREATE TABLE takedown_open_queue (
+  created_hour TIMESTAMP NOT NULL,
+  reason_code VARCHAR(50) NOT NULL,
+  vendor_id UUID NOT NULL,
+  open_count INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (created_hour, reason_code, vendor_id)
+);
+
+CREATE TABLE takedown_open_queue_delta (
+  id BIGSERIAL PRIMARY KEY,
+  created_hour TIMESTAMP NOT NULL,
+  reason_code VARCHAR(50) NOT NULL,
+  vendor_id UUID NOT NULL,
+  open_count INT NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION track_open_takedowns_batch()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO takedown_open_queue_delta (created_hour, reason_code, vendor_id, open_count)
+  SELECT date_trunc('hour', created_at), reason_code, vendor_id, COUNT(*)
+  FROM new_takedown_requests
+  WHERE status = 'open'
+  GROUP BY date_trunc('hour', created_at), reason_code, vendor_id;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables can't be combined with UPDATE OF <column>, so this fires
+-- for every UPDATE statement; rows whose open status didn't change net to
+-- zero and append nothing
+CREATE OR REPLACE FUNCTION track_takedown_status_changes_batch()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO takedown_open_queue_delta (created_hour, reason_code, vendor_id, open_count)
+  SELECT created_hour, reason_code, vendor_id, SUM(change)
+  FROM (
+    SELECT date_trunc('hour', created_at) AS created_hour, reason_code, vendor_id, -1 AS change
+    FROM old_takedown_requests
+    WHERE status = 'open'
+    UNION ALL
+    SELECT date_trunc('hour', created_at), reason_code, vendor_id, 1
+    FROM new_takedown_requests
+    WHERE status = 'open'
+  ) AS changes
+  GROUP BY created_hour, reason_code, vendor_id
+  HAVING SUM(change) <> 0;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION untrack_deleted_takedowns_batch()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO takedown_open_queue_delta (created_hour, reason_code, vendor_id, open_count)
+  SELECT date_trunc('hour', created_at), reason_code, vendor_id, -COUNT(*)
+  FROM old_takedown_requests
+  WHERE status = 'open'
+  GROUP BY date_trunc('hour', created_at), reason_code, vendor_id;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_track_takedown_status_changes ON review_takedown_requests;
+DROP TRIGGER IF EXISTS trg_untrack_deleted_takedowns ON review_takedown_requests;
+
+CREATE TRIGGER trg_track_takedown_status_changes
+  AFTER UPDATE ON review_takedown_requests
+  REFERENCING OLD TABLE AS old_takedown_requests NEW TABLE AS new_takedown_requests
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION track_takedown_status_changes_batch();
+
+CREATE TRIGGER trg_untrack_deleted_takedowns
+  AFTER DELETE ON review_takedown_requests
+  REFERENCING OLD TABLE AS old_takedown_requests
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION untrack_deleted_takedowns_batch();
+
+CREATE OR REPLACE FUNCTION compact_takedown_sketches()
+RETURNS VOID AS $$
+BEGIN
+  IF NOT pg_try_advisory_xact_lock(hashtext('compact_takedown_sketches')) THEN
+    RETURN;
+  END IF;
+
+  WITH moved AS (
+    DELETE FROM takedown_resolution_histogram_delta
+    RETURNING day, reason_code, vendor_id, bucket, count
+  )
+  INSERT INTO takedown_resolution_histogram (day, reason_code, vendor_id, bucket, count)
+  SELECT day, reason_code, vendor_id, bucket, SUM(count)
+  FROM moved
+  GROUP BY day, reason_code, vendor_id, bucket
+  ON CONFLICT (day, reason_code, vendor_id, bucket)
+  DO UPDATE SET count = takedown_resolution_histogram.count + EXCLUDED.count;
+
+  WITH moved AS (
+    DELETE FROM takedown_open_queue_delta
+    RETURNING created_hour, reason_code, vendor_id, open_count
+  )
+  INSERT INTO takedown_open_queue (created_hour, reason_code, vendor_id, open_count)
+  SELECT created_hour, reason_code, vendor_id, SUM(open_count)
+  FROM moved
+  GROUP BY created_hour, reason_code, vendor_id
+  ON CONFLICT (created_hour, reason_code, vendor_id)
+  DO UPDATE SET open_count = takedown_open_queue.open_count + EXCLUDED.open_count;
+
+  -- Hours whose requests have all been resolved
+  DELETE FROM takedown_open_queue WHERE open_count = 0;
+END;
+$$ LANGUAGE plpgsql;
+
+INSERT INTO takedown_open_queue (created_hour, reason_code, vendor_id, open_count)
+SELECT date_trunc('hour', created_at), reason_code, vendor_id, COUNT(*)
+FROM review_takedown_requests
+WHERE status = 'open'
+GROUP BY date_trunc('hour', created_at), reason_code, vendor_id;
 """
+
+
+# ========================================
+# Benchmarks
+# ========================================
+# Run from the backend root, e.g.:
+#   python -m app.routers.admin.reviews_takedown admission
+
+def _percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of raw samples"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _simulate_takedown_load(
+    limiters: Optional[Dict[str, AdmissionLimiter]],
+    rates: Dict[str, float],
+    service_s: Dict[str, float],
+    pool_size: int,
+    db_cores: int,
+    duration_s: float,
+):
+    """
+    Poisson arrivals per endpoint against a simulated DB: a connection pool in
+    front of a server whose queries slow down once more than db_cores run at once.
+    """
+    loop = asyncio.get_running_loop()
+    pool = asyncio.Semaphore(pool_size)
+    running = [0]
+    latencies: Dict[str, List[float]] = {name: [] for name in rates}
+    shed = {name: 0 for name in rates}
+    tasks = []
+
+    async def query(name: str):
+        async with pool:
+            running[0] += 1
+            try:
+                await asyncio.sleep(service_s[name] * max(1.0, running[0] / db_cores))
+            finally:
+                running[0] -= 1
+
+    async def handle(name: str):
+        start = time.perf_counter()
+        try:
+            if limiters is None:
+                await query(name)
+            else:
+                async with limiters[name].admit():
+                    await query(name)
+        except HTTPException:
+            shed[name] += 1
+            return
+        latencies[name].append(time.perf_counter() - start)
+
+    async def arrivals(name: str):
+        rng = random.Random(name)
+        deadline = loop.time() + duration_s
+        while loop.time() < deadline:
+            tasks.append(asyncio.create_task(handle(name)))
+            await asyncio.sleep(rng.expovariate(rates[name]))
+
+    await asyncio.gather(*(arrivals(name) for name in rates))
+    await asyncio.gather(*tasks)
+    return latencies, shed
+
+
+def _bench_admission_overload():
+    """
+    Load test: every takedown endpoint arrives faster than the DB serves.
+
+    Without admission control every request queues on the DB pool and p99
+    grows with the length of the burst; with it, p99 of admitted requests
+    stays bounded, resolve keeps its throughput by borrowing connections
+    ahead of the read endpoints, and the excess is shed with 503.
+    """
+    rates = {
+        "resolve": 100.0, "list": 200.0, "detail": 400.0,
+        "batch_detail": 40.0, "evidence": 60.0, "bulk_create": 5.0,
+    }
+    service_s = {
+        "resolve": 0.03, "list": 0.02, "detail": 0.01,
+        "batch_detail": 0.04, "evidence": 0.02, "bulk_create": 0.2,
+    }
+    scenarios = {
+        "unbounded": None,
+        "admission": _build_admission_limiters(TAKEDOWN_ADMISSION_LIMITS, TAKEDOWN_POOL_BUDGET),
+    }
+    for label, limiters in scenarios.items():
+        latencies, shed = asyncio.run(_simulate_takedown_load(
+            limiters, rates, service_s, pool_size=15, db_cores=4, duration_s=3.0
+        ))
+        for name in rates:
+            print(
+                f"{label:>10} {name:>12}: served={len(latencies[name]):5d} shed={shed[name]:5d} "
+                f"p50={_percentile(latencies[name], 0.50) * 1000:8.1f}ms "
+                f"p99={_percentile(latencies[name], 0.99) * 1000:8.1f}ms"
+            )
+
+
+def _bench_resolution_sketch():
+    """
+    Sketch accuracy: p50/p90/p99 of merged per-day sketches vs exact
+    percentiles of the raw samples (log-normal resolution times).
+    """
+    rng = random.Random(28)
+    days = [[rng.lognormvariate(math.log(6 * 3600), 1.2) for _ in range(2000)] for _ in range(30)]
+    merged = ResolutionTimeSketch()
+    for samples in days:
+        sketch = ResolutionTimeSketch()
+        for seconds in samples:
+            sketch.add(seconds)
+        merged.merge(sketch)
+    exact = [seconds for samples in days for seconds in samples]
+    print(f"samples={len(exact)} buckets={len(merged.buckets)}")
+    for q in (0.50, 0.90, 0.99):
+        true_value = _percentile(exact, q)
+        estimate = merged.quantile(q)
+        print(
+            f"p{int(q * 100):>2}: exact={true_value / 3600:8.2f}h sketch={estimate / 3600:8.2f}h "
+            f"error={abs(estimate - true_value) / true_value * 100:5.2f}%"
+        )
+
+
+def _bench_list_wire_formats(rows: int = 100, repeat: int = 50):
+    """
+    Payload size and per-request time for a list page built from loaded rows
+    and served through FastAPI with the list endpoint's response_model:
+    nested vs normalized, with and without negotiated compression.
+    """
+    from fastapi.testclient import TestClient
+
+    results = [_sample_takedown_row(i) for i in range(rows)]
+    meta = PaginationMeta(
+        page=1, page_size=rows, total_items=rows, total_pages=1, has_next=False, has_prev=False
+    )
+    app = FastAPI()
+    encoding = install_response_compression(app)
+
+    @app.get("/list", response_model=TakedownListAnyResponse)
+    async def list_page(shape: str = "nested"):
+        if shape == "normalized":
+            return build_takedown_list_normalized(results, meta)
+        return build_takedown_list(results, meta)
+
+    with TestClient(app) as client:
+        for shape in ("nested", "normalized"):
+            for accept in ("identity", encoding):
+                headers = {"Accept-Encoding": accept}
+                client.get("/list", params={"shape": shape}, headers=headers)
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    response = client.get("/list", params={"shape": shape}, headers=headers)
+                elapsed_ms = (time.perf_counter() - start) / repeat * 1000
+                print(
+                    f"{shape:>10} rows={rows} encoding={accept:>8}: "
+                    f"wire={int(response.headers['content-length']):7d}B request={elapsed_ms:6.2f}ms"
+                )
+
+
+# Runs in a fresh interpreter so imports and first requests are really cold
+_STARTUP_PROBE = """
+import importlib.util, json, sys, time
+
+def ms(start):
+    return round((time.perf_counter() - start) * 1000, 2)
+
+result = {}
+start = time.perf_counter()
+import fastapi
+result["import_fastapi"] = ms(start)
+start = time.perf_counter()
+import sqlalchemy
+result["import_sqlalchemy"] = ms(start)
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("reviews_takedown", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = module
+spec.loader.exec_module(module)
+result["import_router"] = ms(start)
+
+from fastapi.testclient import TestClient
+app = fastapi.FastAPI()
+app.include_router(module.router, prefix="/api/v1/admin")
+if sys.argv[2] == "warm":
+    module.install_takedown_warmup(app)
+start = time.perf_counter()
+with TestClient(app) as client:
+    result["startup"] = ms(start)
+    for label, url in (
+        ("first_list", "/api/v1/admin/reviews/takedown-requests?shape=normalized"),
+        ("first_openapi", "/openapi.json"),
+        ("first_resolve", "/api/v1/admin/reviews/takedown-requests/" + "0" * 8 + "-0000-0000-0000-" + "0" * 12 + "/resolve"),
+        ("second_list", "/api/v1/admin/reviews/takedown-requests?shape=normalized"),
+    ):
+        start = time.perf_counter()
+        if label == "first_resolve":
+            client.post(url, json={"decision": "reject", "reason": "r" * 50})
+        else:
+            client.get(url)
+        result[label] = ms(start)
+print(json.dumps(result))
+"""
+
+
+def _bench_startup(runs: int = 5):
+    """
+    Worker startup: import time (FastAPI, SQLAlchemy, this router) and
+    first-request latency in fresh interpreters, cold vs with warm-up.
+    Medians over `runs` processes; no DB, so pool pre-fill is not included.
+    """
+    import subprocess
+    import sys
+
+    for mode in ("cold", "warm"):
+        samples = [
+            json.loads(subprocess.run(
+                [sys.executable, "-c", _STARTUP_PROBE, os.path.abspath(__file__), mode],
+                check=True, capture_output=True, text=True,
+            ).stdout.splitlines()[-1])
+            for _ in range(runs)
+        ]
+        print(f"{mode:>5}: " + " ".join(
+            f"{name}={sorted(sample[name] for sample in samples)[runs // 2]:.1f}ms"
+            for name in samples[0]
+        ))
+
+
+_BENCHMARKS = {
+    "admission": _bench_admission_overload,
+    "sketch": _bench_resolution_sketch,
+    "wire": _bench_list_wire_formats,
+    "startup": _bench_startup,
+}
+
+
+if __name__ == "__main__":
+    import sys
+
+    for bench_name in sys.argv[1:] or list(_BENCHMARKS):
+        _BENCHMARKS[bench_name]()